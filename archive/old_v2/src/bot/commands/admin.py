@@ -4,20 +4,27 @@ Admin Commands - Bot management and utilities
 
 import logging
 import platform
-from datetime import datetime
+import time
 
 import discord
 import psutil
+from bot.utils.interactions import respond_lazily, send_error
 from discord import app_commands
 
 logger = logging.getLogger(__name__)
 
+# Parts of /admin status that cannot change while the process runs
+PYTHON_VERSION = platform.python_version()
+DISCORD_VERSION_FIELD = f"Version: {discord.__version__}"
+
 
 class AdminCommands(app_commands.Group):
     """Admin commands for bot management."""
 
     def __init__(self, bot):
-        super().__init__(name="admin", description="Admin commands")
+        # Let Discord hide the group outside servers instead of dispatching the interaction
+        # only to reject it here; ping, status and uptime stay visible to every member
+        super().__init__(name="admin", description="Admin commands", guild_only=True)
         self.bot = bot
 
     @app_commands.command(name="ping", description="Test bot responsiveness")
@@ -52,11 +59,11 @@ class AdminCommands(app_commands.Group):
 
             embed.add_field(
                 name="Bot",
-                value=f"Guilds: {guild_count}\nLatency: {round(self.bot.latency * 1000)}ms\nPython: {platform.python_version()}",
+                value=f"Guilds: {guild_count}\nLatency: {round(self.bot.latency * 1000)}ms\nPython: {PYTHON_VERSION}",
                 inline=True,
             )
 
-            embed.add_field(name="Discord.py", value=f"Version: {discord.__version__}", inline=True)
+            embed.add_field(name="Discord.py", value=DISCORD_VERSION_FIELD, inline=True)
 
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -65,37 +72,39 @@ class AdminCommands(app_commands.Group):
             await interaction.response.send_message("❌ Error retrieving bot status", ephemeral=True)
 
     @app_commands.command(name="sync", description="Sync slash commands")
+    @app_commands.default_permissions(administrator=True)
     async def sync_commands(self, interaction: discord.Interaction):
         """Sync slash commands."""
         try:
-            # Check if user has admin permissions
-            if not interaction.guild:
-                await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-                return
-
-            member = interaction.guild.get_member(interaction.user.id)
-            if not member or not member.guild_permissions.administrator:
+            # Discord only applies default permissions to top-level commands, so syncing keeps its own
+            # check; the invoker's resolved permissions ship with the interaction, no member lookup needed
+            if not interaction.permissions.administrator:
                 await interaction.response.send_message(
                     "❌ You need administrator permissions to use this command.", ephemeral=True
                 )
                 return
 
-            # Sync commands
-            synced = await self.bot.tree.sync()
+            # Sync commands, only deferring if Discord is slow to answer
+            async def _sync():
+                synced = await self.bot.sync_commands(force=True)
+                if synced is None:
+                    return {"content": "❌ Error syncing commands"}
+                return {"content": f"✅ Successfully synced {len(synced)} command(s)!"}
 
-            await interaction.response.send_message(f"✅ Successfully synced {len(synced)} command(s)!", ephemeral=True)
+            await respond_lazily(interaction, _sync())
 
         except Exception as e:
             logger.error(f"Error in sync command: {e}")
-            await interaction.response.send_message("❌ Error syncing commands", ephemeral=True)
+            await send_error(interaction, "❌ Error syncing commands")
 
     @app_commands.command(name="uptime", description="Get bot uptime")
     async def uptime(self, interaction: discord.Interaction):
         """Get bot uptime."""
         try:
-            uptime = datetime.now() - self.bot.start_time
-            days = uptime.days
-            hours, remainder = divmod(uptime.seconds, 3600)
+            # Monotonic clock: plain float math, and immune to wall-clock adjustments
+            elapsed = int(time.monotonic() - self.bot.start_monotonic)
+            days, remainder = divmod(elapsed, 86400)
+            hours, remainder = divmod(remainder, 3600)
             minutes, seconds = divmod(remainder, 60)
 
             if days > 0:
@@ -110,3 +119,8 @@ class AdminCommands(app_commands.Group):
         except Exception as e:
             logger.error(f"Error in uptime command: {e}")
             await interaction.response.send_message("❌ Error getting uptime", ephemeral=True)
+
+
+async def setup(bot):
+    """Setup the /admin slash command group."""
+    bot.tree.add_command(AdminCommands(bot))
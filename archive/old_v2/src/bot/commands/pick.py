@@ -3,35 +3,105 @@ Pick Command - MLB betting pick command with channel selection
 """
 
 import asyncio
+import io
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
 
 import discord
 from bot.services.analysis import AnalysisService
 from bot.services.mlb_integrated_service import MLBIntegratedService
 from bot.services.ocr import OCRService
 from bot.services.player_analytics import PlayerAnalyticsService
-from bot.services.templates import TemplateService
+from bot.services.templates import DEFAULT_TEAMS, TemplateService
 from bot.services.weather_impact import WeatherImpactService
+from config.performance_config import MAX_COMMAND_CACHE_ENTRIES, MAX_SLIP_IMAGE_BYTES
+from config.settings import settings
 from discord import app_commands
 from discord.ext import commands
 
 logger = logging.getLogger(__name__)
 
+# Short-lived response caches for the prefix analysis commands
+MATCHUP_CACHE_TTL = 30
+PLAYER_CACHE_TTL = 15
+
+# Target channel per /pick post channel type, resolved once at import
+CHANNEL_IDS = {
+    "free_play": settings.channels.free_channel_id,
+    "vip_pick": settings.channels.vip_channel_id,
+    "lotto_ticket": settings.channels.lotto_channel_id,
+}
+
+# Discord rejects embed field values longer than this
+EMBED_FIELD_LIMIT = 1024
+
+# Static loading/error embeds, built once and shared - never mutate these
+PICK_LOADING_EMBED = discord.Embed(
+    title="⚾ GotLockz Family - Advanced MLB Analysis",
+    description="Loading comprehensive analysis...",
+    color=0x00FF00,
+).set_footer(text="Powered by advanced MLB analytics")
+PICK_ERROR_EMBED = discord.Embed(
+    title="❌ Error", description="An error occurred while analyzing the game.", color=0xFF0000
+)
+LIVE_LOADING_EMBED = discord.Embed(title="🔴 Live Game Updates", description="Loading live data...", color=0xFF0000)
+NO_LIVE_GAMES_EMBED = discord.Embed(title="🔴 Live Games", description="No active games found", color=0x808080)
+LIVE_ERROR_EMBED = discord.Embed(title="❌ Error", description="Failed to load live updates.", color=0xFF0000)
+PLAYER_ERROR_EMBED = discord.Embed(title="❌ Error", description="Failed to load player data.", color=0xFF0000)
+WEATHER_LOADING_EMBED = discord.Embed(
+    title="🌤️ Weather Impact Analysis", description="Analyzing weather conditions...", color=0x87CEEB
+)
+WEATHER_ERROR_EMBED = discord.Embed(title="❌ Error", description="Failed to analyze weather impact.", color=0xFF0000)
+
+
+def _field_value(text: str) -> str:
+    """Clip generated text to Discord's embed field limit instead of letting the edit fail."""
+    if len(text) <= EMBED_FIELD_LIMIT:
+        return text
+    return text[: EMBED_FIELD_LIMIT - 1] + "…"
+
 
 class PickCommands(app_commands.Group):
     """Commands for posting MLB betting picks."""
 
     def __init__(self, bot):
-        super().__init__(name="pick", description="Post MLB betting picks with analysis")
+        # Picks are posted to server channels, so Discord does not offer the group in DMs
+        super().__init__(name="pick", description="Post MLB betting picks with analysis", guild_only=True)
         self.bot = bot
-        self.ocr_service = OCRService()
-        self.mlb_service = MLBIntegratedService()
+        session = getattr(bot, "http_session", None)
+        self.ocr_service = OCRService(session=session)
+        self.mlb_service = MLBIntegratedService(session=session)
         self.analysis_service = AnalysisService()
         self.template_service = TemplateService()
-        self.player_service = PlayerAnalyticsService()
+        # Channel type -> template formatter, so posting is a dict lookup rather than a string chain
+        self._formatters = {
+            "free_play": self.template_service.format_free_play,
+            "vip_pick": self.template_service.format_vip_pick,
+            "lotto_ticket": self.template_service.format_lotto_ticket,
+        }
+        self.player_service = PlayerAnalyticsService(session=session)
         self.weather_service = WeatherImpactService()
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Run a coroutine in the background, holding a reference until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def close(self):
+        """Stop background work, flush counters and release HTTP resources when the extension is unloaded."""
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self.template_service.close()
+        await self.ocr_service.close()
+        await self.mlb_service.close()
+        await self.player_service.close()
 
     @app_commands.command(name="post", description="Post a betting pick with image analysis and AI")
     @app_commands.describe(
@@ -55,19 +125,18 @@ class PickCommands(app_commands.Group):
     ):
         logger.info("Received /pick post command, deferring response immediately.")
 
-        # Defer immediately to prevent timeout
+        # Defer before any other await to stay inside Discord's 3s window. Every reply below is an
+        # ephemeral followup (the pick itself goes to the target channel), so the deferred
+        # response must be ephemeral too or the first followup would be shown to the whole channel
         try:
-            await interaction.response.defer(thinking=True)
+            await interaction.response.defer(thinking=True, ephemeral=True)
             logger.info("Deferred interaction response successfully.")
         except discord.NotFound:
             logger.error("Interaction already expired - user may have clicked multiple times")
             return
-        except Exception as e:
+        except discord.HTTPException as e:
+            # Unacknowledged interactions cannot take followups, so there is nobody left to tell
             logger.error(f"Failed to defer interaction: {e}")
-            try:
-                await interaction.followup.send("❌ Bot is processing your request. Please wait...", ephemeral=True)
-            except:
-                pass
             return
 
         try:
@@ -76,9 +145,32 @@ class PickCommands(app_commands.Group):
                 await interaction.followup.send("❌ Please provide a valid image file.", ephemeral=True)
                 return
 
-            # Download image with timeout
+            # Reject oversized uploads from the attachment metadata, before any bytes are buffered
+            if image.size > MAX_SLIP_IMAGE_BYTES:
+                await interaction.followup.send(
+                    f"❌ Image is too large. Please upload a slip under {MAX_SLIP_IMAGE_BYTES // (1024 * 1024)} MB.",
+                    ephemeral=True,
+                )
+                return
+
+            # Resolve the target channel up front so misconfiguration fails before any OCR or AI work
+            if not interaction.guild:
+                await interaction.followup.send("❌ This command can only be used in a server.", ephemeral=True)
+                return
+            target_channel = await self._get_target_channel(channel_type, interaction.guild)
+            if not target_channel:
+                await interaction.followup.send(
+                    "❌ Target channel not found. Please check bot configuration.", ephemeral=True
+                )
+                return
+
+            # Warm the MLB service while the slip downloads and goes through OCR
+            self._spawn(self.mlb_service.prefetch())
+
+            # Download image with timeout straight into a reusable buffer
+            image_buffer = io.BytesIO()
             try:
-                image_bytes = await asyncio.wait_for(image.read(), timeout=10.0)
+                await asyncio.wait_for(image.save(image_buffer, seek_begin=True), timeout=10.0)
                 logger.info("Image downloaded successfully.")
             except asyncio.TimeoutError:
                 await interaction.followup.send("❌ Image download timed out. Please try again.", ephemeral=True)
@@ -90,8 +182,8 @@ class PickCommands(app_commands.Group):
 
             # Extract betting data with OCR
             try:
-                bet_data = await asyncio.wait_for(self.ocr_service.extract_bet_data(image_bytes), timeout=15.0)
-                logger.info(f"OCR extraction completed: {bet_data}")
+                bet_data = await asyncio.wait_for(self.ocr_service.extract_bet_data(image_buffer), timeout=15.0)
+                logger.info("OCR extraction completed.")
             except asyncio.TimeoutError:
                 await interaction.followup.send(
                     "❌ Image processing timed out. Please try with a clearer image.", ephemeral=True
@@ -112,7 +204,8 @@ class PickCommands(app_commands.Group):
 
             # If OCR failed to extract teams or bet, notify user
             assert bet_data is not None, "Expected non-None data before calling .get()"
-            if bet_data.get("teams", ["TBD", "TBD"])[0] == "TBD" or bet_data.get("teams", ["TBD", "TBD"])[1] == "TBD":
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
+            if teams[0] == "TBD" or teams[1] == "TBD":
                 await interaction.followup.send(
                     "❌ Could not extract teams from the bet slip. "
                     "Please ensure the image is clear and the team names are visible.",
@@ -165,53 +258,36 @@ class PickCommands(app_commands.Group):
 
             # Format content based on channel type
             try:
-                if channel_type == "free_play":
-                    content = self.template_service.format_free_play(bet_data, stats_data, analysis)
-                elif channel_type == "vip_pick":
-                    content = self.template_service.format_vip_pick(bet_data, stats_data, analysis)
-                elif channel_type == "lotto_ticket":
-                    content = self.template_service.format_lotto_ticket(bet_data, stats_data, analysis)
-                else:
+                formatter = self._formatters.get(channel_type)
+                if formatter is None:
                     await interaction.followup.send("❌ Invalid channel type selected.", ephemeral=True)
                     return
+                content = formatter(bet_data, stats_data, analysis)
                 logger.info("Content formatted successfully.")
             except Exception as e:
                 logger.error(f"Content formatting failed: {e}")
                 await interaction.followup.send("❌ Failed to format content. Please try again.", ephemeral=True)
                 return
 
-            # Get target channel
-            if not interaction.guild:
-                await interaction.followup.send("❌ This command can only be used in a server.", ephemeral=True)
-                return
-            target_channel = await self._get_target_channel(channel_type, interaction.guild)
-            if not target_channel:
-                await interaction.followup.send(
-                    "❌ Target channel not found. Please check bot configuration.", ephemeral=True
-                )
-                return
-
             # Post to target channel with image
             try:
-                # Create a Discord file from the image bytes
-                from io import BytesIO
-
+                # Re-send the downloaded buffer itself rather than a copy of its bytes
+                image_buffer.seek(0)
                 image_file = discord.File(
-                    BytesIO(image_bytes), filename=f"betslip_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+                    image_buffer, filename=f"betslip_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
                 )
 
                 # Post content with image attachment
                 await target_channel.send(content, file=image_file)
                 logger.info(f"Pick posted successfully to {target_channel.name} with image")
 
-                # Send success message to user
-                await interaction.followup.send(
-                    f"✅ Pick posted successfully to {target_channel.mention}!", ephemeral=True
-                )
-
             except Exception as e:
                 logger.error(f"Failed to post pick: {e}")
                 await interaction.followup.send("❌ Failed to post pick. Please try again.", ephemeral=True)
+                return
+
+            # Send success message to user
+            await interaction.followup.send(f"✅ Pick posted successfully to {target_channel.mention}!", ephemeral=True)
 
         except Exception as e:
             logger.error(f"Unexpected error in post_pick: {e}")
@@ -220,16 +296,7 @@ class PickCommands(app_commands.Group):
     async def _get_target_channel(self, channel_type: str, guild: discord.Guild) -> Optional[discord.TextChannel]:
         """Get the target channel based on channel type."""
         try:
-            from config.settings import settings
-
-            channel_id = None
-            if channel_type == "free_play":
-                channel_id = settings.channels.free_channel_id
-            elif channel_type == "vip_pick":
-                channel_id = settings.channels.vip_channel_id
-            elif channel_type == "lotto_ticket":
-                channel_id = settings.channels.lotto_channel_id
-
+            channel_id = CHANNEL_IDS.get(channel_type)
             if not channel_id:
                 return None
 
@@ -249,30 +316,78 @@ class PickCommand(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.mlb_service = MLBIntegratedService()
-        self.player_service = PlayerAnalyticsService()
+        # Share the bot's pooled connections to statsapi.mlb.com rather than opening a pool per service
+        session = getattr(bot, "http_session", None)
+        self.mlb_service = MLBIntegratedService(session=session)
+        self.player_service = PlayerAnalyticsService(session=session)
         self.weather_service = WeatherImpactService()
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        # The cog owns the /pick group: unloading the extension drops the group from the tree
+        # before teardown() runs, so the cog is the only place left that can still close it
+        self.pick_group = PickCommands(bot)
+
+    async def cog_unload(self):
+        """Persist /pick state and release HTTP resources when the cog is removed."""
+        await self.pick_group.close()
+        await self.mlb_service.close()
+        await self.player_service.close()
+
+    async def _cached(self, key: Tuple[Any, ...], ttl: float, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a recent result for `key`, fetching and storing a fresh one when it has expired.
+
+        Empty results are not stored so a failed lookup is retried on the next invocation.
+        """
+        cached = self._cache.get(key)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            self._cache.move_to_end(key)
+            return cached[1]
+
+        value = await coro_factory()
+        if value:
+            now = time.monotonic()
+            # Drop expired entries first, then the least recently used ones past the cap
+            for stale in [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]:
+                del self._cache[stale]
+            self._cache[key] = (now + ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > MAX_COMMAND_CACHE_ENTRIES:
+                self._cache.popitem(last=False)
+        return value
+
+    async def _ensure_mlb_service(self):
+        """Initialize the MLB service on first use."""
+        if not self.mlb_service.initialized:
+            await self.mlb_service.initialize()
+
+    async def _get_player_analytics(self, player_name: str, team: str) -> Optional[Dict[str, Any]]:
+        """Player analytics, or None when the lookup failed so the miss is not cached."""
+        analytics = await self.player_service.get_player_analytics(player_name, team)
+        return None if "error" in analytics else analytics
+
+    async def _get_matchup_analysis(self, team1: str, team2: str) -> Optional[Dict[str, Any]]:
+        """Matchup analysis, or None when the lookup failed so the miss is not cached."""
+        analysis = await self.player_service.get_matchup_analysis(team1, team2)
+        return None if "error" in analysis else analysis
+
+    def _analyze_game_weather(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Weather impact at the venue of the first team in the game data."""
+        team1_data = game_data.get("team1", {})
+        venue = team1_data.get("info", {}).get("venue", "Unknown")
+        return self.weather_service.analyze_weather_impact(team1_data.get("weather", {}), venue)
 
     @commands.command(name="pick", help="Get advanced MLB analysis for a game")
     async def pick(self, ctx, team1: str, team2: str):
         """Get comprehensive MLB analysis including real-time updates, player analytics, and weather impact."""
         try:
             # Send initial response
-            embed = discord.Embed(
-                title="⚾ GotLockz Family - Advanced MLB Analysis",
-                description="Loading comprehensive analysis...",
-                color=0x00FF00,
-            )
-            embed.set_footer(text="Powered by advanced MLB analytics")
-            message = await ctx.send(embed=embed)
+            message = await ctx.send(embed=PICK_LOADING_EMBED)
 
-            # Initialize service if needed
-            if not self.mlb_service.initialized:
-                await self.mlb_service.initialize()
+            await self._ensure_mlb_service()
 
-            # Get comprehensive game data
-            bet_data = {"teams": [team1, team2]}
-            game_data = await self.mlb_service.get_comprehensive_game_data(bet_data)
+            # Get game data, matchup analysis and live updates in one round
+            dashboard = await self._get_game_dashboard(team1, team2)
+            game_data = dashboard["game_data"]
 
             if not game_data:
                 error_embed = discord.Embed(
@@ -283,18 +398,10 @@ class PickCommand(commands.Cog):
                 await message.edit(embed=error_embed)
                 return
 
-            # Extract weather data for analysis
-            team1_weather = game_data.get("team1", {}).get("weather", {})
-            venue = game_data.get("team1", {}).get("info", {}).get("venue", "Unknown")
-
             # Get advanced analytics
-            weather_impact = self.weather_service.analyze_weather_impact(team1_weather, venue)
-            matchup_analysis = await self.player_service.get_matchup_analysis(team1, team2)
-
-            # Get live updates if scraper is available
-            live_updates = {}
-            if self.mlb_service.scraper:
-                live_updates = await self.mlb_service.scraper.get_live_game_updates()
+            weather_impact = self._analyze_game_weather(game_data)
+            matchup_analysis = dashboard["matchup_analysis"]
+            live_updates = dashboard["live_updates"]
 
             # Build comprehensive embed
             embed = await self._build_advanced_embed(
@@ -305,29 +412,22 @@ class PickCommand(commands.Cog):
 
         except Exception as e:
             logger.error(f"Error in pick command: {e}")
-            error_embed = discord.Embed(
-                title="❌ Error", description="An error occurred while analyzing the game.", color=0xFF0000
-            )
-            await message.edit(embed=error_embed)
+            await message.edit(embed=PICK_ERROR_EMBED)
 
     @commands.command(name="live", help="Get real-time game updates")
     async def live(self, ctx, game_id: Optional[str] = None):
         """Get real-time updates for active games."""
         try:
-            embed = discord.Embed(title="🔴 Live Game Updates", description="Loading live data...", color=0xFF0000)
-            message = await ctx.send(embed=embed)
+            message = await ctx.send(embed=LIVE_LOADING_EMBED)
 
-            # Initialize service if needed
-            if not self.mlb_service.initialized:
-                await self.mlb_service.initialize()
+            await self._ensure_mlb_service()
 
             live_updates = {}
             if self.mlb_service.scraper:
                 live_updates = await self.mlb_service.scraper.get_live_game_updates(game_id)
 
             if not live_updates:
-                embed = discord.Embed(title="🔴 Live Games", description="No active games found", color=0x808080)
-                await message.edit(embed=embed)
+                await message.edit(embed=NO_LIVE_GAMES_EMBED)
                 return
 
             embed = await self._build_live_embed(live_updates)
@@ -335,11 +435,10 @@ class PickCommand(commands.Cog):
 
         except Exception as e:
             logger.error(f"Error in live command: {e}")
-            error_embed = discord.Embed(title="❌ Error", description="Failed to load live updates.", color=0xFF0000)
-            await message.edit(embed=error_embed)
+            await message.edit(embed=LIVE_ERROR_EMBED)
 
-    @commands.command(name="player", help="Get advanced player analytics")
-    async def player(self, ctx, player_name: str):
+    @commands.command(name="player", help="Get advanced player analytics (optionally narrowed by team)")
+    async def player(self, ctx, player_name: str, team: str = ""):
         """Get comprehensive player statistics and analysis."""
         try:
             embed = discord.Embed(
@@ -347,7 +446,11 @@ class PickCommand(commands.Cog):
             )
             message = await ctx.send(embed=embed)
 
-            player_stats = await self.player_service.analyze_player_stats(player_name)
+            player_stats = await self._cached(
+                ("player", player_name.lower(), team.lower()),
+                PLAYER_CACHE_TTL,
+                lambda: self._get_player_analytics(player_name, team),
+            )
 
             if not player_stats:
                 embed = discord.Embed(
@@ -361,25 +464,18 @@ class PickCommand(commands.Cog):
 
         except Exception as e:
             logger.error(f"Error in player command: {e}")
-            error_embed = discord.Embed(title="❌ Error", description="Failed to load player data.", color=0xFF0000)
-            await message.edit(embed=error_embed)
+            await message.edit(embed=PLAYER_ERROR_EMBED)
 
     @commands.command(name="weather", help="Get weather impact analysis")
     async def weather(self, ctx, team1: str, team2: str):
         """Get detailed weather impact analysis for a game."""
         try:
-            embed = discord.Embed(
-                title="🌤️ Weather Impact Analysis", description="Analyzing weather conditions...", color=0x87CEEB
-            )
-            message = await ctx.send(embed=embed)
+            message = await ctx.send(embed=WEATHER_LOADING_EMBED)
 
-            # Initialize service if needed
-            if not self.mlb_service.initialized:
-                await self.mlb_service.initialize()
+            await self._ensure_mlb_service()
 
-            # Get game data for weather
-            bet_data = {"teams": [team1, team2]}
-            game_data = await self.mlb_service.get_comprehensive_game_data(bet_data)
+            # Get game data for weather; MLBIntegratedService keeps recent matchups cached
+            game_data = await self.mlb_service.get_comprehensive_game_data({"teams": [team1, team2]})
 
             if not game_data:
                 error_embed = discord.Embed(
@@ -390,20 +486,49 @@ class PickCommand(commands.Cog):
                 await message.edit(embed=error_embed)
                 return
 
-            team1_weather = game_data.get("team1", {}).get("weather", {})
-            venue = game_data.get("team1", {}).get("info", {}).get("venue", "Unknown")
-
-            weather_impact = self.weather_service.analyze_weather_impact(team1_weather, venue)
+            weather_impact = self._analyze_game_weather(game_data)
 
             embed = await self._build_weather_embed(weather_impact, team1, team2)
             await message.edit(embed=embed)
 
         except Exception as e:
             logger.error(f"Error in weather command: {e}")
-            error_embed = discord.Embed(
-                title="❌ Error", description="Failed to analyze weather impact.", color=0xFF0000
-            )
-            await message.edit(embed=error_embed)
+            await message.edit(embed=WEATHER_ERROR_EMBED)
+
+    async def _get_game_dashboard(self, team1: str, team2: str) -> Dict[str, Any]:
+        """Fetch game data, matchup analysis and live updates concurrently.
+
+        Each branch degrades to an empty result on failure so one slow or broken
+        source never takes the whole analysis down with it.
+        """
+
+        async def _live_updates():
+            if not self.mlb_service.scraper:
+                return {}
+            return await self.mlb_service.scraper.get_live_game_updates()
+
+        results = await asyncio.gather(
+            self.mlb_service.get_comprehensive_game_data({"teams": [team1, team2]}),
+            self._cached(
+                ("matchup", team1.lower(), team2.lower()),
+                MATCHUP_CACHE_TTL,
+                lambda: self._get_matchup_analysis(team1, team2),
+            ),
+            _live_updates(),
+            return_exceptions=True,
+        )
+
+        dashboard = {}
+        for key, result in zip(("game_data", "matchup_analysis", "live_updates"), results):
+            if isinstance(result, Exception):
+                logger.warning(f"Dashboard branch '{key}' failed for {team1} vs {team2}: {result}")
+                result = None if key == "game_data" else {}
+            dashboard[key] = result
+
+        # A failed matchup lookup comes back as None so it is never cached
+        dashboard["matchup_analysis"] = dashboard["matchup_analysis"] or {}
+
+        return dashboard
 
     async def _build_advanced_embed(
         self,
@@ -421,13 +546,14 @@ class PickCommand(commands.Cog):
             color=0x00FF00,
             timestamp=datetime.now(),
         )
+        add_field = embed.add_field
 
         # Basic game info
         team1_data = game_data.get("team1", {})
         team2_data = game_data.get("team2", {})
 
         # Game summary
-        embed.add_field(
+        add_field(
             name="🏟️ Game Info",
             value=f"**{team1}** vs **{team2}**\n"
             f"Venue: {team1_data.get('info', {}).get('venue', 'Unknown')}\n"
@@ -439,13 +565,13 @@ class PickCommand(commands.Cog):
         team1_stats = team1_data.get("basic_stats", {})
         team2_stats = team2_data.get("basic_stats", {})
 
-        embed.add_field(
+        add_field(
             name=f"📊 {team1}",
             value=f"Record: {team1_stats.get('record', 'N/A')}\n" f"Win %: {team1_stats.get('win_pct', 0):.3f}",
             inline=True,
         )
 
-        embed.add_field(
+        add_field(
             name=f"📊 {team2}",
             value=f"Record: {team2_stats.get('record', 'N/A')}\n" f"Win %: {team2_stats.get('win_pct', 0):.3f}",
             inline=True,
@@ -455,16 +581,15 @@ class PickCommand(commands.Cog):
         weather_summary = self.weather_service.get_weather_summary(
             team1_data.get("weather", {}), team1_data.get("info", {}).get("venue")
         )
-        embed.add_field(name="🌤️ Weather Impact", value=weather_summary, inline=False)
+        add_field(name="🌤️ Weather Impact", value=_field_value(weather_summary), inline=False)
 
         # Live updates if available
         active_games = live_updates.get("active_games", [])
         if active_games:
+            matchup = {team1, team2}
             for game in active_games:
-                if (game.get("away_team") == team1 and game.get("home_team") == team2) or (
-                    game.get("away_team") == team2 and game.get("home_team") == team1
-                ):
-                    embed.add_field(
+                if {game.get("away_team"), game.get("home_team")} == matchup:
+                    add_field(
                         name="🔴 Live Game",
                         value=f"Score: {game.get('away_score', 0)}-{game.get('home_score', 0)}\n"
                         f"Inning: {game.get('current_inning', 'N/A')} {game.get('inning_state', '')}\n"
@@ -476,7 +601,7 @@ class PickCommand(commands.Cog):
         # Matchup analysis
         if matchup_analysis:
             key_matchups = matchup_analysis.get("key_matchups", [])
-            embed.add_field(
+            add_field(
                 name="⚔️ Key Matchups",
                 value=f"{len(key_matchups)} key matchups identified\n" "Focus on starting pitcher performance",
                 inline=False,
@@ -500,8 +625,9 @@ class PickCommand(commands.Cog):
 
         embed.description = f"**{total_active}** active games"
 
-        for i, game in enumerate(active_games[:5]):  # Show max 5 games
-            embed.add_field(
+        add_field = embed.add_field
+        for game in active_games[:5]:  # Show max 5 games
+            add_field(
                 name=f"⚾ {game.get('away_team')} @ {game.get('home_team')}",
                 value=f"Score: **{game.get('away_score', 0)}-{game.get('home_score', 0)}**\n"
                 f"Inning: {game.get('current_inning', 'N/A')} {game.get('inning_state', '')}\n"
@@ -515,50 +641,49 @@ class PickCommand(commands.Cog):
 
     async def _build_player_embed(self, player_stats: Dict[str, Any]) -> discord.Embed:
         """Build player analytics embed."""
-        player_info = player_stats.get("player_info", {})
-        batting_stats = player_stats.get("batting", {})
-        pitching_stats = player_stats.get("pitching", {})
+        stats = player_stats.get("stats", {})
+        batting_stats = stats.get("hitting", {})
+        pitching_stats = stats.get("pitching", {})
+        recent_games = player_stats.get("recent_performance", {}).get("recent_games", [])
 
         embed = discord.Embed(
-            title=f"👤 {player_info.get('name', 'Unknown Player')}",
+            title=f"👤 {player_stats.get('player_name', 'Unknown Player')}",
             description=f"Advanced player analytics",
             color=0x0099FF,
             timestamp=datetime.now(),
         )
+        add_field = embed.add_field
 
         # Player info
-        embed.add_field(
+        add_field(
             name="📋 Player Info",
-            value=f"Position: {player_info.get('position', 'N/A')}\n"
-            f"Team: {player_info.get('team', 'N/A')}\n"
-            f"Age: {player_info.get('age', 'N/A')}\n"
-            f"Bats: {player_info.get('bats', 'N/A')} | Throws: {player_info.get('throws', 'N/A')}",
+            value=f"Team: {player_stats.get('team') or 'N/A'}\n" f"Recent games tracked: {len(recent_games)}",
             inline=False,
         )
 
-        # Batting stats
+        # Batting stats (the MLB API reports rate stats as preformatted strings)
         if batting_stats:
-            embed.add_field(
+            add_field(
                 name="⚾ Batting Stats",
-                value=f"AVG: {batting_stats.get('avg', 0):.3f}\n"
-                f"OBP: {batting_stats.get('obp', 0):.3f}\n"
-                f"SLG: {batting_stats.get('slg', 0):.3f}\n"
-                f"HR: {batting_stats.get('home_runs', 0)} | RBI: {batting_stats.get('rbi', 0)}",
+                value=f"AVG: {batting_stats.get('avg', 'N/A')}\n"
+                f"OBP: {batting_stats.get('obp', 'N/A')}\n"
+                f"SLG: {batting_stats.get('slg', 'N/A')}\n"
+                f"HR: {batting_stats.get('homeRuns', 0)} | RBI: {batting_stats.get('rbi', 0)}",
                 inline=True,
             )
 
         # Pitching stats
         if pitching_stats:
-            embed.add_field(
+            add_field(
                 name="🎯 Pitching Stats",
-                value=f"ERA: {pitching_stats.get('era', 0):.2f}\n"
+                value=f"ERA: {pitching_stats.get('era', 'N/A')}\n"
                 f"W-L: {pitching_stats.get('wins', 0)}-{pitching_stats.get('losses', 0)}\n"
-                f"SO: {pitching_stats.get('strikeouts', 0)}\n"
-                f"WHIP: {pitching_stats.get('whip', 0):.2f}",
+                f"SO: {pitching_stats.get('strikeOuts', 0)}\n"
+                f"WHIP: {pitching_stats.get('whip', 'N/A')}",
                 inline=True,
             )
 
-        embed.set_footer(text=f"Season: {player_stats.get('season', 'N/A')}")
+        embed.set_footer(text=f"Last updated: {player_stats.get('last_updated', 'N/A')}")
         return embed
 
     async def _build_weather_embed(self, weather_impact: Dict[str, Any], team1: str, team2: str) -> discord.Embed:
@@ -569,13 +694,14 @@ class PickCommand(commands.Cog):
             color=0x87CEEB,
             timestamp=datetime.now(),
         )
+        add_field = embed.add_field
 
         overall_impact = weather_impact.get("overall_impact", {})
         recommendations = weather_impact.get("recommendations", [])
         betting_implications = weather_impact.get("betting_implications", {})
 
         # Overall impact
-        embed.add_field(
+        add_field(
             name="📊 Overall Impact",
             value=f"Category: **{overall_impact.get('category', 'Unknown')}**\n"
             f"Factor: {overall_impact.get('factor', 1.0)}\n"
@@ -586,25 +712,26 @@ class PickCommand(commands.Cog):
 
         # Recommendations
         if recommendations:
-            rec_text = "\n".join([f"• {rec}" for rec in recommendations[:3]])
-            embed.add_field(name="💡 Recommendations", value=rec_text, inline=False)
+            rec_text = "\n".join(f"• {rec}" for rec in recommendations[:3])
+            add_field(name="💡 Recommendations", value=_field_value(rec_text), inline=False)
 
         # Betting implications
         if betting_implications:
-            bet_text = ""
-            for bet_type, data in betting_implications.items():
-                bet_text += (
-                    f"• **{bet_type.replace('_', ' ').title()}**: "
-                    f"{data.get('adjustment', '0%')} - "
-                    f"{data.get('recommendation', 'Neutral')}\n"
-                )
+            bet_text = "\n".join(
+                f"• **{bet_type.replace('_', ' ').title()}**: "
+                f"{data.get('adjustment', '0%')} - "
+                f"{data.get('recommendation', 'Neutral')}"
+                for bet_type, data in betting_implications.items()
+            )
 
-            embed.add_field(name="💰 Betting Implications", value=bet_text, inline=False)
+            add_field(name="💰 Betting Implications", value=_field_value(bet_text), inline=False)
 
         embed.set_footer(text="Weather analysis based on historical MLB data")
         return embed
 
 
 async def setup(bot):
-    """Setup the pick command cog."""
-    await bot.add_cog(PickCommand(bot))
+    """Setup the pick command cog and the /pick slash command group."""
+    cog = PickCommand(bot)
+    await bot.add_cog(cog)
+    bot.tree.add_command(cog.pick_group)
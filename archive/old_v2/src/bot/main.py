@@ -3,82 +3,157 @@ Main Discord bot file with proper logging and error handling
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 import sys
+import time
+from datetime import datetime
+from typing import List, Optional
 
+import aiohttp
 import discord
 from discord.ext import commands
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from bot.utils.http import create_session, json_dumps
 from bot.utils.system_monitor import system_monitor
-from config.settings import BOT_TOKEN, setup_logging
+from config.performance_config import COMMAND_SIGNATURE_FILE
+from config.settings import BOT_TOKEN, REQUEST_TIMEOUT, setup_logging
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
 # Bot setup
-intents = discord.Intents.default()
-intents.message_content = True
-bot = commands.Bot(command_prefix="!", intents=intents)
-
-
-@bot.event
-async def on_ready():
-    """Bot startup event with logging"""
-    assert bot.user is not None, "Expected non-None user before accessing .name"
-    assert bot.user is not None, "Expected non-None user before accessing .id"
-    logger.info(f"Bot logged in as {bot.user.name} (ID: {bot.user.id})")
-    logger.info(f"Connected to {len(bot.guilds)} guilds")
-
-    # Start system monitoring
-    await system_monitor.start_monitoring(interval_seconds=60)  # Check every minute
-    logger.info("System monitoring started")
-
-    # Log guild information
-    for guild in bot.guilds:
-        assert guild is not None, "Expected non-None user before accessing .name"
-        assert guild is not None, "Expected non-None user before accessing .id"
-        logger.info(f"Guild: {guild.name} (ID: {guild.id}) - Members: {guild.member_count}")
-
-
-@bot.event
-async def on_command(ctx):
-    """Log all command usage"""
-    assert ctx.command is not None, "Expected non-None user before accessing .name"
-    assert ctx.author is not None, "Expected non-None user before accessing .name"
-    assert ctx.guild is not None, "Expected non-None user before accessing .name"
-    logger.info(f"Command executed: {ctx.command.name} by {ctx.author} in {ctx.guild.name}")
-
-
-@bot.event
-async def on_command_error(ctx, error):
-    """Log command errors"""
-    if isinstance(error, commands.CommandNotFound):
-        assert ctx.author is not None, "Expected non-None user before accessing .name"
-        logger.warning(f"Command not found: {ctx.message.content} by {ctx.author}")
-    elif isinstance(error, commands.MissingPermissions):
-        assert ctx.author is not None, "Expected non-None user before accessing .name"
-        assert ctx.command is not None, "Expected non-None user before accessing .name"
-        logger.warning(f"Missing permissions: {ctx.author} tried to use {ctx.command.name}")
-    else:
-        assert ctx.command is not None, "Expected non-None user before accessing .name"
-        logger.error(f"Command error in {ctx.command.name}: {error}", exc_info=True)
+COMMAND_PREFIX = "!"
+EXTENSIONS = ["bot.commands.pick", "bot.commands.admin"]
+
+
+class GotLockzBot(commands.Bot):
+    """GotLockz Discord bot with a shared HTTP session for all outbound API calls."""
+
+    def __init__(self):
+        # Only subscribe to the gateway events the bot handles; typing, reactions,
+        # voice and invite events would otherwise be streamed and parsed for nothing
+        intents = discord.Intents(guilds=True, guild_messages=True, message_content=True)
+        # Commands never look up past messages, so skip the 1000-message cache
+        super().__init__(command_prefix=COMMAND_PREFIX, intents=intents, max_messages=None)
+        self.start_time = datetime.now()
+        self.start_monotonic = time.monotonic()
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        self._ready_once = False
+
+    async def setup_hook(self):
+        """Create the shared HTTP session and load command extensions before connecting"""
+        self.http_session = create_session(aiohttp.ClientTimeout(total=REQUEST_TIMEOUT))
+        logger.info("Shared HTTP session created")
+
+        await self._load_extensions()
+        await self.sync_commands()
+
+    async def _load_extensions(self):
+        """Load bot command extensions with error handling"""
+        for extension in EXTENSIONS:
+            try:
+                await self.load_extension(extension)
+                logger.info(f"Loaded extension: {extension}")
+            except Exception as e:
+                logger.error(f"Failed to load extension {extension}: {e}")
+
+    def _command_signature(self) -> str:
+        """Hash the payload tree.sync() uploads, so any change Discord would store triggers a sync."""
+        payload = [command.to_dict(self.tree) for command in self.tree.get_commands()]
+        # Commands are registered per application, so a different bot token must sync as well
+        return hashlib.sha256(json_dumps([self.application_id, payload])).hexdigest()
+
+    async def sync_commands(self, force: bool = False) -> Optional[List[discord.app_commands.AppCommand]]:
+        """Sync slash commands with Discord unless they match the last synced signature"""
+        signature = self._command_signature()
+        if not force:
+            try:
+                with open(COMMAND_SIGNATURE_FILE, "r") as f:
+                    if f.read().strip() == signature:
+                        logger.info("Slash commands unchanged since last sync, skipping")
+                        return None
+            except FileNotFoundError:
+                pass
 
+        try:
+            synced = await self.tree.sync()
+        except Exception as e:
+            logger.error(f"Failed to sync slash commands: {e}")
+            return None
 
-async def load_extensions():
-    """Load bot command extensions with error handling"""
-    extensions = ["bot.commands.pick", "bot.commands.admin"]
-
-    for extension in extensions:
+        logger.info(f"Synced {len(synced)} slash command(s)")
         try:
-            await bot.load_extension(extension)
-            logger.info(f"Loaded extension: {extension}")
+            with open(COMMAND_SIGNATURE_FILE, "w") as f:
+                f.write(signature)
         except Exception as e:
-            logger.error(f"Failed to load extension {extension}: {e}")
+            logger.error(f"Failed to save command signature: {e}")
+        return synced
+
+    async def close(self):
+        """Close the shared HTTP session before disconnecting"""
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+            logger.info("Shared HTTP session closed")
+        await super().close()
+
+    async def on_ready(self):
+        """Bot startup event with logging"""
+        assert self.user is not None, "Expected non-None user before accessing .name"
+        assert self.user is not None, "Expected non-None user before accessing .id"
+        logger.info(f"Bot logged in as {self.user.name} (ID: {self.user.id})")
+        logger.info(f"Connected to {len(self.guilds)} guilds")
+
+        # on_ready fires again after every gateway reconnect; only do startup work once
+        if self._ready_once:
+            return
+        self._ready_once = True
+
+        # Start system monitoring
+        await system_monitor.start_monitoring(interval_seconds=60)  # Check every minute
+        logger.info("System monitoring started")
+
+        # Log guild information
+        for guild in self.guilds:
+            assert guild is not None, "Expected non-None user before accessing .name"
+            assert guild is not None, "Expected non-None user before accessing .id"
+            logger.info(f"Guild: {guild.name} (ID: {guild.id}) - Members: {guild.member_count}")
+
+    async def on_message(self, message):
+        """Only hand messages that can be prefix commands to the command parser"""
+        # Prefix test first: one str method rejects almost all chat before touching the author,
+        # whose .bot also covers the bot's own messages without a User.__eq__ comparison
+        if not message.content.startswith(COMMAND_PREFIX) or message.author.bot:
+            return
+        await self.process_commands(message)
+
+    async def on_command(self, ctx):
+        """Log all command usage"""
+        assert ctx.command is not None, "Expected non-None user before accessing .name"
+        assert ctx.author is not None, "Expected non-None user before accessing .name"
+        assert ctx.guild is not None, "Expected non-None user before accessing .name"
+        logger.info(f"Command executed: {ctx.command.name} by {ctx.author} in {ctx.guild.name}")
+
+    async def on_command_error(self, ctx, error):
+        """Log command errors"""
+        if isinstance(error, commands.CommandNotFound):
+            assert ctx.author is not None, "Expected non-None user before accessing .name"
+            logger.warning(f"Command not found: {ctx.message.content} by {ctx.author}")
+        elif isinstance(error, commands.MissingPermissions):
+            assert ctx.author is not None, "Expected non-None user before accessing .name"
+            assert ctx.command is not None, "Expected non-None user before accessing .name"
+            logger.warning(f"Missing permissions: {ctx.author} tried to use {ctx.command.name}")
+        else:
+            assert ctx.command is not None, "Expected non-None user before accessing .name"
+            logger.error(f"Command error in {ctx.command.name}: {error}", exc_info=True)
+
+
+bot = GotLockzBot()
 
 
 async def shutdown_bot():
@@ -100,9 +175,6 @@ async def main():
     try:
         logger.info("Starting MLB bot...")
 
-        # Load command extensions
-        await load_extensions()
-
         # Start the bot
         if not BOT_TOKEN:
             logger.error("No Discord bot token found! Set DISCORD_BOT_TOKEN environment variable.")
@@ -13,6 +13,7 @@ import pandas as pd
 from bot.services.statcast import StatcastService
 from bot.services.weather import WeatherService
 from bot.utils import kelly_fraction
+from bot.utils.http import create_session, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,7 @@ class AdvancedStatsService:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=15)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = create_session(timeout)
         return self.session
 
     async def get_advanced_stats(self, bet_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -212,7 +213,7 @@ class AdvancedStatsService:
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
 
                 for team in data.get("teams", []):
                     if team_name.lower() in team.get("name", "").lower():
@@ -234,7 +235,7 @@ class AdvancedStatsService:
                 if response.status != 200:
                     return {}
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 return self._parse_batting_stats(data)
 
         except Exception as e:
@@ -251,7 +252,7 @@ class AdvancedStatsService:
                 if response.status != 200:
                     return {}
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 return self._parse_pitching_stats(data)
 
         except Exception as e:
@@ -278,7 +279,7 @@ class AdvancedStatsService:
                 if response.status != 200:
                     return {}
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 return self._parse_recent_performance(data, team_id)
 
         except Exception as e:
@@ -423,7 +424,7 @@ class AdvancedStatsService:
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
 
                 for team in data.get("teams", []):
                     if team_name.lower() in team.get("name", "").lower():
@@ -444,7 +445,7 @@ class AdvancedStatsService:
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 return self._parse_mlb_team_stats(data)
 
         except Exception as e:
@@ -3,27 +3,63 @@ Analysis Service - AI-powered MLB betting analysis
 """
 
 import asyncio
+import hashlib
 import logging
 import random
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
-import openai
+from bot.services.templates import DEFAULT_TEAMS
+from bot.utils.performance_limiter import ai_gate
+from config.performance_config import CACHE_TIMEOUT_ANALYSIS, MAX_ANALYSIS_CACHE_ENTRIES
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+CONTEXT_ERROR = "Error building analysis context"
+
+# The OpenAI SDK takes the better part of a second to import, so it is loaded on first use
+# (on the executor thread that makes the call) rather than while the bot is starting up
+openai = None
+
+
+def _import_openai():
+    """Import the OpenAI SDK once and return the module."""
+    global openai
+    if openai is None:
+        import openai as openai_module
+
+        openai = openai_module
+    return openai
+
+
+def _round(value: Any, digits: int = 1) -> Any:
+    """Round raw float stats so the prompt carries one meaningful decimal, not seventeen."""
+    if isinstance(value, float):
+        return round(value, digits)
+    return value
+
 
 class AnalysisService:
     """Service for AI-powered MLB betting analysis."""
 
     def __init__(self):
-        try:
-            self.client = openai.OpenAI(api_key=settings.api.openai_api_key)
-            self.model = settings.api.openai_model or "gpt-4"
-            logger.info(f"OpenAI client initialized with model: {self.model}")
-        except Exception as e:
-            logger.error(f"Failed to initialize OpenAI client: {e}")
-            raise Exception(f"Failed to initialize OpenAI client: {e}")
+        self.client = None
+        self.model = settings.api.openai_model or "gpt-4"
+        # Completed analyses keyed by prompt context, so identical picks skip the API round-trip
+        self._analysis_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def _get_client(self):
+        """Create the OpenAI client on first use. Blocking, so call it off the event loop."""
+        if self.client is None:
+            try:
+                self.client = _import_openai().OpenAI(api_key=settings.api.openai_api_key)
+                logger.info(f"OpenAI client initialized with model: {self.model}")
+            except Exception as e:
+                logger.error(f"Failed to initialize OpenAI client: {e}")
+                raise Exception(f"Failed to initialize OpenAI client: {e}")
+        return self.client
 
     async def generate_analysis(self, bet_data: Dict[str, Any], stats_data: Optional[Dict[str, Any]] = None) -> str:
         """Generate AI analysis for MLB betting data."""
@@ -43,7 +79,7 @@ class AnalysisService:
     def _build_context(self, bet_data: Dict[str, Any], stats_data: Optional[Dict[str, Any]]) -> str:
         """Build context for AI analysis with enhanced stats."""
         try:
-            teams = bet_data.get("teams", ["TBD", "TBD"])
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
             description = bet_data.get("description", "TBD")
             odds = bet_data.get("odds", "TBD")
             is_parlay = bet_data.get("is_parlay", False)
@@ -77,8 +113,8 @@ class AnalysisService:
             - Pitching: {team1_stats.get('era', 0):.2f} ERA, {team1_stats.get('whip', 0):.2f} WHIP
             - Recent: {team1_stats.get('recent_wins', 0)}-{team1_stats.get('recent_losses', 0)} last \
               {team1_stats.get('recent_games', 0)} games
-            - Recent Avg: {team1_stats.get('avg_runs_scored', 0)} scored, \
-              {team1_stats.get('avg_runs_allowed', 0)} allowed
+            - Recent Avg: {_round(team1_stats.get('avg_runs_scored', 0))} scored, \
+              {_round(team1_stats.get('avg_runs_allowed', 0))} allowed
             
             {teams[1]}:
             - Record: {team2_stats.get('wins', 0)}-{team2_stats.get('losses', 0)} ({team2_stats.get('win_pct', 0):.3f})
@@ -89,8 +125,8 @@ class AnalysisService:
             - Pitching: {team2_stats.get('era', 0):.2f} ERA, {team2_stats.get('whip', 0):.2f} WHIP
             - Recent: {team2_stats.get('recent_wins', 0)}-{team2_stats.get('recent_losses', 0)} last \
               {team2_stats.get('recent_games', 0)} games
-            - Recent Avg: {team2_stats.get('avg_runs_scored', 0)} scored, \
-              {team2_stats.get('avg_runs_allowed', 0)} allowed
+            - Recent Avg: {_round(team2_stats.get('avg_runs_scored', 0))} scored, \
+              {_round(team2_stats.get('avg_runs_allowed', 0))} allowed
             """
 
                 # Add Statcast data if available
@@ -104,16 +140,16 @@ class AnalysisService:
             Statcast Data (Last 30 Days):
             
             {teams[0]}:
-            - Batting: {team1_statcast.get('batting', {}).get('avg_exit_velocity', 0)} mph exit velo, \
-              {team1_statcast.get('batting', {}).get('barrel_pct', 0)}% barrel rate
-            - Pitching: {team1_statcast.get('pitching', {}).get('avg_velocity', 0)} mph avg velo, \
-              {team1_statcast.get('pitching', {}).get('whiff_pct', 0)}% whiff rate
+            - Batting: {_round(team1_statcast.get('batting', {}).get('avg_exit_velocity', 0))} mph exit velo, \
+              {_round(team1_statcast.get('batting', {}).get('barrel_pct', 0))}% barrel rate
+            - Pitching: {_round(team1_statcast.get('pitching', {}).get('avg_velocity', 0))} mph avg velo, \
+              {_round(team1_statcast.get('pitching', {}).get('whiff_pct', 0))}% whiff rate
             
             {teams[1]}:
-            - Batting: {team2_statcast.get('batting', {}).get('avg_exit_velocity', 0)} mph exit velo, \
-              {team2_statcast.get('batting', {}).get('barrel_pct', 0)}% barrel rate
-            - Pitching: {team2_statcast.get('pitching', {}).get('avg_velocity', 0)} mph avg velo, \
-              {team2_statcast.get('pitching', {}).get('whiff_pct', 0)}% whiff rate
+            - Batting: {_round(team2_statcast.get('batting', {}).get('avg_exit_velocity', 0))} mph exit velo, \
+              {_round(team2_statcast.get('batting', {}).get('barrel_pct', 0))}% barrel rate
+            - Pitching: {_round(team2_statcast.get('pitching', {}).get('avg_velocity', 0))} mph avg velo, \
+              {_round(team2_statcast.get('pitching', {}).get('whiff_pct', 0))}% whiff rate
             """
 
                 if park_factors:
@@ -140,7 +176,7 @@ class AnalysisService:
 
         except Exception as e:
             logger.error(f"Error building context: {e}")
-            return "Error building analysis context"
+            return CONTEXT_ERROR
 
     async def _generate_ai_analysis(self, context: str) -> str:
         """Generate AI analysis using OpenAI with enhanced stats-driven insights."""
@@ -153,6 +189,14 @@ class AnalysisService:
                 "Lockz fam, let's break down today's best spot!",
             ]
             intro = random.choice(intros)
+
+            cache_key = hashlib.blake2b(context.encode(), digest_size=16).hexdigest()
+            cached = self._analysis_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < CACHE_TIMEOUT_ANALYSIS:
+                self._analysis_cache.move_to_end(cache_key)
+                logger.info("Reusing AI analysis for identical pick context")
+                return f"{intro}\n\n{cached[1]}"
+
             prompt = f"""
 You are a sharp, trusted MLB bettor analyzing for a 21+ Discord community. Use Discord bold markdown (**text**) for key teams, stats, or phrases. Write exactly three short paragraphs:
 
@@ -171,26 +215,32 @@ Context:
 """
             # Use asyncio to run the OpenAI call in a thread pool to prevent blocking
             loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a sharp, trusted MLB bettor writing for a 21+ Discord audience. Use a mature, confident, stats-driven, and analytical tone. Avoid corny or kid language and forced hype. Use Discord bold markdown (**text**) for key teams, stats, or phrases. Write exactly three short paragraphs as described. Use emojis only for emphasis. Do NOT generate an intro, the intro will be provided. Start your response directly with the first paragraph. End with 'Let's cash.' or 'Lock it in.'",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    max_tokens=400,
-                    temperature=0.7,
-                ),
-            )
+            async with ai_gate:
+                response = await loop.run_in_executor(
+                    None,
+                    lambda: self._get_client().chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {
+                                "role": "system",
+                                "content": "You are a sharp, trusted MLB bettor writing for a 21+ Discord audience. Use a mature, confident, stats-driven, and analytical tone. Avoid corny or kid language and forced hype. Use Discord bold markdown (**text**) for key teams, stats, or phrases. Write exactly three short paragraphs as described. Use emojis only for emphasis. Do NOT generate an intro, the intro will be provided. Start your response directly with the first paragraph. End with 'Let's cash.' or 'Lock it in.'",
+                            },
+                            {"role": "user", "content": prompt},
+                        ],
+                        max_tokens=400,
+                        temperature=0.7,
+                    ),
+                )
 
             if response and response.choices and len(response.choices) > 0:
                 message_content = response.choices[0].message.content
                 if message_content:
                     analysis = message_content.strip()
+                    if context != CONTEXT_ERROR:
+                        self._analysis_cache[cache_key] = (time.monotonic(), analysis)
+                        self._analysis_cache.move_to_end(cache_key)
+                        while len(self._analysis_cache) > MAX_ANALYSIS_CACHE_ENTRIES:
+                            self._analysis_cache.popitem(last=False)
                     return f"{intro}\n\n{analysis}"
                 else:
                     logger.warning("Empty response from OpenAI API")
@@ -198,23 +248,25 @@ Context:
             else:
                 logger.warning("No response choices from OpenAI API")
                 return f"{intro}\n\nAI analysis temporarily unavailable. Please check the betting data manually."
-        except openai.AuthenticationError:
-            logger.error("OpenAI authentication failed - check API key")
-            return "AI analysis unavailable: Authentication error. Please check OpenAI API configuration."
-        except openai.RateLimitError:
-            logger.error("OpenAI rate limit exceeded")
-            return "AI analysis temporarily unavailable due to rate limits. Please try again later."
-        except openai.APIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            return f"AI analysis unavailable: API error. Please try again later."
         except Exception as e:
+            # SDK errors can only be raised once the SDK has been imported
+            if openai is not None:
+                if isinstance(e, openai.AuthenticationError):
+                    logger.error("OpenAI authentication failed - check API key")
+                    return "AI analysis unavailable: Authentication error. Please check OpenAI API configuration."
+                if isinstance(e, openai.RateLimitError):
+                    logger.error("OpenAI rate limit exceeded")
+                    return "AI analysis temporarily unavailable due to rate limits. Please try again later."
+                if isinstance(e, openai.APIError):
+                    logger.error(f"OpenAI API error: {e}")
+                    return f"AI analysis unavailable: API error. Please try again later."
             logger.error(f"Error generating AI analysis: {e}")
             return "AI analysis temporarily unavailable. Please check the betting data manually."
 
     def _get_fallback_analysis(self, bet_data: Dict[str, Any]) -> str:
         """Get fallback analysis when AI is unavailable."""
         try:
-            teams = bet_data.get("teams", ["TBD", "TBD"])
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
             description = bet_data.get("description", "TBD")
             odds = bet_data.get("odds", "TBD")
 
@@ -233,7 +285,7 @@ Context:
     async def generate_quick_analysis(self, bet_data: Dict[str, Any]) -> str:
         """Generate a quick analysis without API calls."""
         try:
-            teams = bet_data.get("teams", ["TBD", "TBD"])
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
             description = bet_data.get("description", "TBD")
             odds = bet_data.get("odds", "TBD")
 
@@ -241,9 +293,10 @@ Context:
                 return "Quick Analysis: Team information not detected. Please ensure the betting slip image is clear and contains team names."
 
             # Generate basic analysis based on bet type
-            if "over" in description.lower():
+            description_lower = description.lower()
+            if "over" in description_lower:
                 return f"Quick Analysis: Over bet for {teams[0]} vs {teams[1]}. Consider recent scoring trends and pitching matchups."
-            elif "under" in description.lower():
+            elif "under" in description_lower:
                 return f"Quick Analysis: Under bet for {teams[0]} vs {teams[1]}. Review recent defensive performance and weather conditions."
             else:
                 return f"Quick Analysis: {description} for {teams[0]} vs {teams[1]}. Check recent form and head-to-head statistics."
@@ -257,7 +310,7 @@ Context:
     ) -> str:
         """Generate risk assessment for the bet."""
         try:
-            teams = bet_data.get("teams", ["TBD", "TBD"])
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
             description = bet_data.get("description", "TBD")
             is_parlay = bet_data.get("is_parlay", False)
 
@@ -3,11 +3,15 @@ MLB Integrated Service - Fast, unified MLB data service using the new scraper
 """
 
 import asyncio
+import copy
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import aiohttp
 from bot.services.mlb_scraper import MLBScraper
+from config.performance_config import CACHE_TIMEOUT_GAME_DATA
 
 logger = logging.getLogger(__name__)
 
@@ -15,24 +19,41 @@ logger = logging.getLogger(__name__)
 class MLBIntegratedService:
     """Fast, unified service for all MLB data using the new scraper."""
 
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        self.session = session
         self.scraper = None
         self.initialized = False
+        self._game_cache: Dict[tuple, tuple] = {}
+        # Concurrent callers (a /pick warmup and its game lookup) share one scraper setup
+        self._init_lock = asyncio.Lock()
 
     async def initialize(self):
-        """Initialize the MLB scraper."""
+        """Initialize the MLB scraper; a no-op once it has succeeded."""
+        async with self._init_lock:
+            if self.initialized and self.scraper:
+                return True
+            try:
+                self.scraper = MLBScraper(session=self.session)
+                success = await self.scraper.initialize()
+                if success:
+                    self.initialized = True
+                    logger.info("MLB Integrated Service initialized successfully")
+                else:
+                    logger.error("Failed to initialize MLB scraper")
+                return success
+            except Exception as e:
+                logger.error(f"Error initializing MLB Integrated Service: {e}")
+                return False
+
+    async def prefetch(self):
+        """Initialize the scraper and warm team-independent data ahead of a game lookup."""
         try:
-            self.scraper = MLBScraper()
-            success = await self.scraper.initialize()
-            if success:
-                self.initialized = True
-                logger.info("MLB Integrated Service initialized successfully")
-            else:
-                logger.error("Failed to initialize MLB scraper")
-            return success
+            if not self.initialized or not self.scraper:
+                await self.initialize()
+            if self.initialized and self.scraper:
+                await self.scraper.prefetch_live_scores()
         except Exception as e:
-            logger.error(f"Error initializing MLB Integrated Service: {e}")
-            return False
+            logger.warning(f"MLB prefetch failed: {e}")
 
     async def get_comprehensive_game_data(self, bet_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Get comprehensive game data for betting analysis using the fast scraper."""
@@ -47,6 +68,14 @@ class MLBIntegratedService:
             if len(teams) < 2:
                 return None
 
+            # Picks on the same game tend to arrive in bursts, so reuse a recent result
+            key = (teams[0], teams[1])
+            now = time.monotonic()
+            cached = self._game_cache.get(key)
+            if cached and now - cached[0] < CACHE_TIMEOUT_GAME_DATA:
+                # Callers annotate the returned dict, so never hand out the cached instance
+                return copy.deepcopy(cached[1])
+
             # Use the fast scraper to get all data
             game_data = await self.scraper.get_game_data(teams[0], teams[1])
 
@@ -57,12 +86,21 @@ class MLBIntegratedService:
             # Transform the data to match the expected format
             transformed_data = self._transform_game_data(game_data, bet_data)
 
+            if transformed_data:
+                self._store_game_data(key, transformed_data)
+
             return transformed_data
 
         except Exception as e:
             logger.error(f"Error getting comprehensive game data: {e}")
             return None
 
+    def _store_game_data(self, key: tuple, data: Dict[str, Any]):
+        """Cache transformed game data, dropping expired entries so the cache stays bounded."""
+        now = time.monotonic()
+        self._game_cache = {k: v for k, v in self._game_cache.items() if now - v[0] < CACHE_TIMEOUT_GAME_DATA}
+        self._game_cache[key] = (now, copy.deepcopy(data))
+
     def _transform_game_data(self, game_data: Dict[str, Any], bet_data: Dict[str, Any]) -> Dict[str, Any]:
         """Transform scraper data to match the expected format for the bot."""
         try:
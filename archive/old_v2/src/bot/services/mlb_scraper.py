@@ -4,13 +4,14 @@ Improved MLB Scraper - Fast, reliable data collection for MLB games
 
 import asyncio
 import logging
-import os
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import aiohttp
+from bot.utils.http import create_session, json_loads, request_with_backoff
 from bot.utils.performance_limiter import rate_limit, safe_operation
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +19,11 @@ logger = logging.getLogger(__name__)
 class MLBScraper:
     """High-performance MLB data scraper"""
 
-    def __init__(self):
-        self.session = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize the scraper, optionally reusing the bot's shared HTTP session."""
+        self.session = session
+        # Only sessions created here are closed here; a shared one belongs to the bot
+        self._owns_session = session is None
         self.cache = {}
         self.cache_timeout = 300  # 5 minutes
         self.timeout = aiohttp.ClientTimeout(total=10)
@@ -65,21 +69,29 @@ class MLBScraper:
     async def initialize(self):
         """Initialize the scraper with session."""
         try:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+            if self.session is None or self.session.closed:
+                self.session = create_session(self.timeout)
+                self._owns_session = True
             logger.info("MLB Scraper initialized")
+            return True
         except Exception as e:
             logger.error(f"Error initializing MLB Scraper: {e}")
+            return False
 
     async def close(self):
         """Close the scraper session."""
-        if self.session and not self.session.closed:
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
 
+    async def prefetch_live_scores(self):
+        """Warm the live scores cache so the next game lookup only fetches team-specific data."""
+        await safe_operation(self._get_live_scores)
+
     @rate_limit(max_requests=5)
     async def get_game_data(self, team1: str, team2: str) -> Dict[str, Any]:
         """Get comprehensive game data for two teams"""
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
 
             # Get team info
             team1_info = self.team_mapping.get(team1)
@@ -109,7 +121,7 @@ class MLBScraper:
             # Check if teams are playing today
             today_game = self._find_today_game(live_scores, team1_info["abbr"], team2_info["abbr"])
 
-            total_time = time.time() - start_time
+            total_time = time.monotonic() - start_time
             logger.info(f"Game data fetched in {total_time:.2f}s")
 
             return {
@@ -131,23 +143,23 @@ class MLBScraper:
         # Check cache first
         if cache_key in self.cache:
             cache_time, data = self.cache[cache_key]
-            if time.time() - cache_time < self.cache_timeout:
+            if time.monotonic() - cache_time < self.cache_timeout:
                 return data
 
         try:
             url = f"{self.mlb_base}/teams/{team_id}/stats"
             params = {"season": datetime.now().year, "group": "hitting,pitching"}
 
-            async with self.session.get(url, params=params) as response:
-                if response.status != 200:
-                    return {}
+            status, body = await request_with_backoff(self.session, "GET", url, params=params, timeout=self.timeout)
+            if status != 200:
+                return {}
 
-                data = await response.json()
-                stats = self._parse_team_stats(data)
+            data = json_loads(body)
+            stats = self._parse_team_stats(data)
 
-                # Cache the result
-                self.cache[cache_key] = (time.time(), stats)
-                return stats
+            # Cache the result
+            self.cache[cache_key] = (time.monotonic(), stats)
+            return stats
 
         except Exception as e:
             logger.error(f"Error getting team stats for {team_id}: {e}")
@@ -161,33 +173,33 @@ class MLBScraper:
         # Check cache first
         if cache_key in self.cache:
             cache_time, data = self.cache[cache_key]
-            if time.time() - cache_time < 300:  # 5 minute cache for weather
+            if time.monotonic() - cache_time < 300:  # 5 minute cache for weather
                 return data
 
         try:
-            api_key = os.getenv("OPENWEATHER_API_KEY")
+            api_key = settings.api.openweather_api_key
             if not api_key:
                 return {"error": "No weather API key"}
 
             url = self.weather_api
             params = {"q": city, "appid": api_key, "units": "imperial"}
 
-            async with self.session.get(url, params=params) as response:
-                if response.status != 200:
-                    return {}
-
-                data = await response.json()
-                weather = {
-                    "temperature": data.get("main", {}).get("temp"),
-                    "humidity": data.get("main", {}).get("humidity"),
-                    "wind_speed": data.get("wind", {}).get("speed"),
-                    "description": data.get("weather", [{}])[0].get("description"),
-                    "city": city,
-                }
+            status, body = await request_with_backoff(self.session, "GET", url, params=params, timeout=self.timeout)
+            if status != 200:
+                return {}
+
+            data = json_loads(body)
+            weather = {
+                "temperature": data.get("main", {}).get("temp"),
+                "humidity": data.get("main", {}).get("humidity"),
+                "wind_speed": data.get("wind", {}).get("speed"),
+                "description": data.get("weather", [{}])[0].get("description"),
+                "city": city,
+            }
 
-                # Cache the result
-                self.cache[cache_key] = (time.time(), weather)
-                return weather
+            # Cache the result
+            self.cache[cache_key] = (time.monotonic(), weather)
+            return weather
 
         except Exception as e:
             logger.error(f"Error getting weather for {city}: {e}")
@@ -201,7 +213,7 @@ class MLBScraper:
         # Check cache first (shorter cache for live data)
         if cache_key in self.cache:
             cache_time, data = self.cache[cache_key]
-            if time.time() - cache_time < 60:  # 1 minute cache for live data
+            if time.monotonic() - cache_time < 60:  # 1 minute cache for live data
                 return data
 
         try:
@@ -209,40 +221,63 @@ class MLBScraper:
             params = {
                 "sportId": 1,
                 "date": datetime.now().strftime("%Y-%m-%d"),
-                "fields": "dates,games,gamePk,teams,away,home,team,abbreviation,score,status",
+                "hydrate": "linescore",
+                "fields": (
+                    "dates,games,gamePk,teams,away,home,team,abbreviation,score,status,detailedState,"
+                    "linescore,currentInning,inningState,outs"
+                ),
             }
 
-            async with self.session.get(url, params=params) as response:
-                if response.status != 200:
-                    return []
-
-                data = await response.json()
-                games = []
-
-                for date_data in data.get("dates", []):
-                    for game in date_data.get("games", []):
-                        away_team = game.get("teams", {}).get("away", {})
-                        home_team = game.get("teams", {}).get("home", {})
-
-                        games.append(
-                            {
-                                "game_id": game.get("gamePk"),
-                                "away_team": away_team.get("team", {}).get("abbreviation"),
-                                "home_team": home_team.get("team", {}).get("abbreviation"),
-                                "away_score": away_team.get("score"),
-                                "home_score": home_team.get("score"),
-                                "status": game.get("status", {}).get("detailedState"),
-                            }
-                        )
-
-                # Cache the result
-                self.cache[cache_key] = (time.time(), games)
-                return games
+            status, body = await request_with_backoff(self.session, "GET", url, params=params, timeout=self.timeout)
+            if status != 200:
+                return []
+
+            data = json_loads(body)
+            games = []
+
+            for date_data in data.get("dates", []):
+                for game in date_data.get("games", []):
+                    away_team = game.get("teams", {}).get("away", {})
+                    home_team = game.get("teams", {}).get("home", {})
+                    linescore = game.get("linescore", {})
+
+                    games.append(
+                        {
+                            "game_id": game.get("gamePk"),
+                            "away_team": away_team.get("team", {}).get("abbreviation"),
+                            "home_team": home_team.get("team", {}).get("abbreviation"),
+                            "away_score": away_team.get("score"),
+                            "home_score": home_team.get("score"),
+                            "status": game.get("status", {}).get("detailedState"),
+                            "current_inning": linescore.get("currentInning", "N/A"),
+                            "inning_state": linescore.get("inningState", ""),
+                            "outs": linescore.get("outs", 0),
+                        }
+                    )
+
+            # Cache the result
+            self.cache[cache_key] = (time.monotonic(), games)
+            return games
 
         except Exception as e:
             logger.error(f"Error getting live scores: {e}")
             return []
 
+    async def get_live_game_updates(self, game_id: Optional[str] = None) -> Dict[str, Any]:
+        """Summarize today's in-progress games from the cached schedule, optionally for a single game."""
+        games = await self._get_live_scores()
+        active_games = [game for game in games if game.get("status") == "In Progress"]
+        if game_id is not None:
+            active_games = [game for game in active_games if str(game.get("game_id")) == str(game_id)]
+        if not active_games:
+            return {}
+
+        return {
+            "active_games": active_games,
+            "total_active": len(active_games),
+            "last_updated": datetime.now().strftime("%H:%M:%S"),
+        }
+
     def _find_today_game(
         self, live_scores: List[Dict[str, Any]], team1_abbr: str, team2_abbr: str
     ) -> Optional[Dict[str, Any]]:
@@ -2,24 +2,114 @@
 OCR Service - Image processing and text extraction
 """
 
+import asyncio
+import copy
+import hashlib
 import io
 import logging
-import os
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
 import aiohttp
-from PIL import Image
+from bot.utils.http import create_session, json_loads, request_with_backoff
+from bot.utils.performance_limiter import ocr_gate
+from config.performance_config import CACHE_TIMEOUT_OCR, MAX_OCR_CACHE_ENTRIES, OCR_PROCESS_WORKERS
+from config.settings import REQUEST_TIMEOUT, settings
+from PIL import Image, ImageOps
 
 logger = logging.getLogger(__name__)
 
+MAX_OCR_IMAGE_SIZE = (2000, 2000)
+
+# Slip parsing patterns, compiled once instead of on every line of every slip. parse_betting_slip
+# lowercases the text up front, so none of them pay for case-insensitive matching
+BET_AMOUNT_PATTERN = re.compile(r"bet[:\s]*\$?(\d+(?:\.\d{2})?)")
+PAYOUT_PATTERN = re.compile(r"(?:payout|win|to win)[:\s]*\$?(\d+(?:\.\d{2})?)")
+ODDS_PATTERN = re.compile(r"([+-]\d{3,4})")
+TEAM_PATTERNS = [
+    re.compile(r"(\w+(?:\s+\w+)*)\s+@\s+(\w+(?:\s+\w+)*)"),  # Team @ Team
+    re.compile(r"(\w+(?:\s+\w+)*)\s+vs\s+(\w+(?:\s+\w+)*)"),  # Team vs Team
+    re.compile(r"(\w+(?:\s+\w+)*)\s+-\s+(\w+(?:\s+\w+)*)"),  # Team - Team
+]
+OVER_UNDER_PATTERN = re.compile(r"(\w+)\s+(over|under)\s+(\d+(?:\.\d)?)")
+MONEYLINE_PATTERN = re.compile(r"(\w+)\s+ml\s*([+-]\d{3,4})")
+PLAYER_PROP_PATTERN = re.compile(r"(\w+\s+\w+)\s+(hits|runs|rbis|strikeouts)\s+(over|under)\s+(\d+(?:\.\d)?)")
+LINE_NOISE_PATTERN = re.compile(r"[^\w\s@\-+.]")
+TEAM_NOISE_PATTERN = re.compile(r"[^\w\s]")
+
+# Substrings that mark a (lowercased) line as carrying bet information, matched in one pass
+BET_LINE_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "over",
+            "under",
+            "money line",
+            "no",
+            "yes",
+            "parlay",
+            "inning",
+            "earned runs",
+            "alt",
+            "hits",
+            "runs",
+            "rbis",
+            "+",
+            "-",
+        )
+    )
+)
+
+# Sportsbook branding and disclaimer text on (already lowercased) slip lines, matched in one pass
+BRANDING_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "fanatics sportsbook",
+            "fanatics",
+            "sportsbook",
+            "fcash",
+            "bet id",
+            "must be 21+",
+            "gambling problem",
+            "call",
+            "1-800-gambler",
+            "rg",
+        )
+    )
+)
+
+# Shorthand team names that are not in the main mapping
+TEAM_VARIATIONS = {
+    "ny": "New York Yankees",
+    "nyc": "New York Yankees",
+    "la": "Los Angeles Dodgers",
+    "sf": "San Francisco Giants",
+    "sd": "San Diego Padres",
+    "chicago": "Chicago Cubs",
+    "cubs": "Chicago Cubs",
+    "sox": "Chicago White Sox",
+    "white sox": "Chicago White Sox",
+}
+
 
 class OCRService:
     """Service for parsing betting slips from OCR text."""
 
-    def __init__(self):
-        """Initialize OCR service."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize OCR service, optionally reusing the bot's shared HTTP session."""
+        self.session = session
+        # Pooled fallback session, created only when no shared session was handed in
+        self._own_session: Optional[aiohttp.ClientSession] = None
+        # Worker processes for image preparation, started on first use when OCR_PROCESS_WORKERS > 0
+        self._image_pool: Optional[ProcessPoolExecutor] = None
+        # Parsed results keyed by image digest, so re-submitted slips skip OCR entirely
+        self._result_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
         self.team_mappings = {
             # MLB Teams
             "nyy": "New York Yankees",
@@ -83,42 +173,93 @@ class OCRService:
             "lad": "Los Angeles Dodgers",
             "dodgers": "Los Angeles Dodgers",
         }
-        self.ocr_space_api_key = os.getenv("OCR_SPACE_API_KEY", "K87115193688957")
+        self.ocr_space_api_key = settings.api.ocr_space_api_key
         self.ocr_space_url = "https://api.ocr.space/parse/image"
 
-    async def extract_bet_data(self, image_bytes: bytes) -> Dict[str, Any]:
-        """Extract betting data from image bytes using OCR.space."""
+    async def extract_bet_data(self, image: Union[bytes, BinaryIO]) -> Dict[str, Any]:
+        """Extract betting data from image bytes or a readable image buffer using OCR.space."""
         try:
-            # Extract text using OCR.space
-            text = await self._extract_text_ocr_space(image_bytes)
-            logger.info(f"OCR.space result: {text}")
-
-            # Parse betting data
-            bet_data = self.parse_betting_slip(text)
-            logger.info(f"Parsed bet data: {bet_data}")
-
-            return bet_data
+            key = self._image_key(image)
+            cached = self._get_cached_result(key)
+            if cached is not None:
+                logger.info("Reusing OCR result for previously seen slip image")
+                return cached
+
+            # An identical slip is already being processed; share its result instead of a second OCR call
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                logger.info("Waiting on in-flight OCR for identical slip image")
+                shared = await asyncio.shield(inflight)
+                if shared is not None:
+                    return copy.deepcopy(shared)
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                # Extract text using OCR.space
+                text = await self._extract_text_ocr_space(image)
+
+                # Parse betting data
+                bet_data = self.parse_betting_slip(text)
+                # Full dumps are debug-only; %-style args skip the repr entirely at INFO
+                logger.debug("Parsed bet data: %s", bet_data)
+
+                if text:
+                    self._store_cached_result(key, bet_data)
+                    future.set_result(copy.deepcopy(bet_data))
+                return bet_data
+            finally:
+                # Failed or cancelled runs resolve to None so waiters retry on their own
+                if not future.done():
+                    future.set_result(None)
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
 
         except Exception as e:
             logger.error(f"Error extracting bet data: {e}")
             return self._get_default_bet_data()
 
-    async def _extract_text_ocr_space(self, image_bytes: bytes) -> str:
+    @staticmethod
+    def _image_key(image: Union[bytes, BinaryIO]) -> str:
+        """Digest the raw image so identical uploads map to the same cache entry."""
+        if isinstance(image, (bytes, bytearray)):
+            data = image
+        elif isinstance(image, io.BytesIO):
+            data = image.getbuffer()
+        else:
+            # Other streams are read once and rewound so OCR still sees the whole image
+            position = image.tell()
+            data = image.read()
+            image.seek(position)
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _get_cached_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached result, dropping it if expired."""
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= CACHE_TIMEOUT_OCR:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        # Callers annotate the returned dict, so never hand out the cached instance
+        return copy.deepcopy(cached[1])
+
+    def _store_cached_result(self, key: str, bet_data: Dict[str, Any]):
+        """Cache a parsed result, evicting the least recently used entry when full."""
+        self._result_cache[key] = (time.monotonic(), copy.deepcopy(bet_data))
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > MAX_OCR_CACHE_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+    async def _extract_text_ocr_space(self, image: Union[bytes, BinaryIO]) -> str:
         """Extract text using OCR.space API."""
         try:
-            # Prepare the image for OCR.space
-            image = Image.open(io.BytesIO(image_bytes))
+            # Decoding and re-encoding is CPU-bound, keep it off the event loop
+            img_byte_arr = await self._run_prepare_image(image)
 
-            # Convert to RGB if needed
-            if image.mode != "RGB":
-                image = image.convert("RGB")
-
-            # Save to bytes
-            img_byte_arr = io.BytesIO()
-            image.save(img_byte_arr, format="PNG")
-            img_byte_arr = img_byte_arr.getvalue()
-
-            async with aiohttp.ClientSession() as session:
+            def build_form() -> aiohttp.FormData:
+                # FormData is consumed on send, so retries need a fresh instance
                 form_data = aiohttp.FormData()
                 form_data.add_field("apikey", self.ocr_space_api_key)
                 form_data.add_field("language", "eng")
@@ -128,31 +269,101 @@ class OCRService:
                 form_data.add_field("scale", "true")
                 form_data.add_field("OCREngine", "2")
                 form_data.add_field("image", img_byte_arr, filename="bet_slip.png", content_type="image/png")
+                return form_data
 
-                async with session.post(self.ocr_space_url, data=form_data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-
-                        if result.get("IsErroredOnProcessing"):
-                            logger.error(f"OCR.space error: {result.get('ErrorMessage')}")
-                            return ""
-
-                        parsed_results = result.get("ParsedResults", [])
-                        if parsed_results:
-                            extracted_text = parsed_results[0].get("ParsedText", "")
-                            logger.info(f"OCR.space extracted text: {extracted_text}")
-                            return extracted_text
-                        else:
-                            logger.warning("OCR.space returned no parsed results")
-                            return ""
-                    else:
-                        logger.error(f"OCR.space API error: {response.status}")
-                        return ""
+            async with ocr_gate:
+                return await self._post_ocr_space(self._get_session(), build_form)
 
         except Exception as e:
             logger.error(f"Error with OCR.space API: {e}")
             return ""
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, or a pooled one kept for the life of the service.
+
+        Either way the TCP/TLS connection to OCR.space stays warm between slips instead of
+        being re-established for every upload.
+        """
+        if self.session and not self.session.closed:
+            return self.session
+        if self._own_session is None or self._own_session.closed:
+            self._own_session = create_session(aiohttp.ClientTimeout(total=REQUEST_TIMEOUT))
+        return self._own_session
+
+    async def close(self):
+        """Close the fallback session and image workers if this service created them."""
+        if self._own_session and not self._own_session.closed:
+            await self._own_session.close()
+        if self._image_pool is not None:
+            self._image_pool.shutdown(wait=False, cancel_futures=True)
+            self._image_pool = None
+
+    async def _run_prepare_image(self, image: Union[bytes, BinaryIO]) -> bytes:
+        """Prepare a slip image on a worker thread, or a worker process when configured.
+
+        Pillow drops the GIL for most of the work, so threads are the default. Worker processes
+        also parallelize the Python-side glue when many slips arrive at once on a multi-core host.
+        """
+        if OCR_PROCESS_WORKERS <= 0:
+            return await asyncio.to_thread(self._prepare_image, image)
+
+        if self._image_pool is None:
+            self._image_pool = ProcessPoolExecutor(max_workers=OCR_PROCESS_WORKERS)
+        # Buffers cannot be pickled across the process boundary; raw bytes can
+        data = image.getvalue() if isinstance(image, io.BytesIO) else image
+        if not isinstance(data, bytes):
+            data = data.read()
+        return await asyncio.get_running_loop().run_in_executor(self._image_pool, self._prepare_image, data)
+
+    @staticmethod
+    def _prepare_image(image_source: Union[bytes, BinaryIO]) -> bytes:
+        """Normalize a slip image to a size-capped, contrast-stretched grayscale PNG for OCR.space."""
+        if isinstance(image_source, bytes):
+            image_source = io.BytesIO(image_source)
+        image = Image.open(image_source)
+
+        # JPEG slips can be decoded straight to scaled-down grayscale; other formats ignore this
+        image.draft("L", MAX_OCR_IMAGE_SIZE)
+
+        # Colored sportsbook backgrounds carry no text information, so drop to one channel
+        # before resizing - the resample then touches a third of the data
+        image = image.convert("L")
+
+        # Oversized screenshots only slow down the upload and the OCR engine
+        image.thumbnail(MAX_OCR_IMAGE_SIZE)
+
+        # A stretched histogram reads as well and encodes to a much smaller PNG
+        image = ImageOps.autocontrast(image, cutoff=1)
+
+        # Save to bytes
+        img_byte_arr = io.BytesIO()
+        image.save(img_byte_arr, format="PNG")
+        return img_byte_arr.getvalue()
+
+    async def _post_ocr_space(
+        self, session: aiohttp.ClientSession, build_form: Callable[[], aiohttp.FormData]
+    ) -> str:
+        """Send an OCR.space request, retrying transient failures, and return the parsed text."""
+        status, body = await request_with_backoff(session, "POST", self.ocr_space_url, data_factory=build_form)
+        if status != 200:
+            logger.error(f"OCR.space API error: {status}")
+            return ""
+
+        result = json_loads(body)
+
+        if result.get("IsErroredOnProcessing"):
+            logger.error(f"OCR.space error: {result.get('ErrorMessage')}")
+            return ""
+
+        parsed_results = result.get("ParsedResults", [])
+        if not parsed_results:
+            logger.warning("OCR.space returned no parsed results")
+            return ""
+
+        extracted_text = parsed_results[0].get("ParsedText", "")
+        logger.debug("OCR.space extracted text: %s", extracted_text)
+        return extracted_text
+
     def parse_betting_slip(self, text: str) -> Dict[str, Any]:
         """Parse betting data from extracted text. Handles all Fanatics MLB slip types, with improved SGP/parlay leg extraction."""
 
@@ -204,22 +415,10 @@ class OCRService:
         """Extract basic slip information."""
         try:
             info = {}
-            branding_keywords = [
-                "fanatics sportsbook",
-                "fanatics",
-                "sportsbook",
-                "fcash",
-                "bet id",
-                "must be 21+",
-                "gambling problem",
-                "call",
-                "1-800-gambler",
-                "rg",
-            ]
 
             # Determine bet type
             for line in lines:
-                if any(keyword in line for keyword in branding_keywords):
+                if BRANDING_PATTERN.search(line):
                     continue
 
                 if "parlay" in line:
@@ -239,17 +438,17 @@ class OCRService:
             # Extract bet amount and payout
             for line in lines:
                 # Look for bet amount patterns
-                bet_match = re.search(r"bet[:\s]*\$?(\d+(?:\.\d{2})?)", line)
+                bet_match = BET_AMOUNT_PATTERN.search(line)
                 if bet_match:
                     info["bet_amount"] = float(bet_match.group(1))
 
                 # Look for payout patterns
-                payout_match = re.search(r"(?:payout|win|to win)[:\s]*\$?(\d+(?:\.\d{2})?)", line)
+                payout_match = PAYOUT_PATTERN.search(line)
                 if payout_match:
                     info["potential_payout"] = float(payout_match.group(1))
 
                 # Look for odds
-                odds_match = re.search(r"([+-]\d{3,4})", line)
+                odds_match = ODDS_PATTERN.search(line)
                 if odds_match:
                     info["odds"] = odds_match.group(1)
 
@@ -263,23 +462,16 @@ class OCRService:
         """Extract team names from text."""
         try:
             teams_found = []
-            team_patterns = [
-                r"(\w+(?:\s+\w+)*)\s+@\s+(\w+(?:\s+\w+)*)",  # Team @ Team
-                r"(\w+(?:\s+\w+)*)\s+vs\s+(\w+(?:\s+\w+)*)",  # Team vs Team
-                r"(\w+(?:\s+\w+)*)\s+-\s+(\w+(?:\s+\w+)*)",  # Team - Team
-            ]
 
             for line in lines:
-                for pattern in team_patterns:
-                    matches = re.findall(pattern, line, re.IGNORECASE)
-                    if matches:
-                        for matchup_teams in matches:
-                            if len(matchup_teams) == 2:
-                                team1 = self._resolve_team_name(matchup_teams[0].strip())
-                                team2 = self._resolve_team_name(matchup_teams[1].strip())
-                                if team1 and team2:
-                                    teams_found = [team1, team2]
-                                    break
+                for pattern in TEAM_PATTERNS:
+                    # finditer scans lazily, so the line is not searched past the first resolvable matchup
+                    for match in pattern.finditer(line):
+                        team1 = self._resolve_team_name(match.group(1).strip())
+                        team2 = self._resolve_team_name(match.group(2).strip())
+                        if team1 and team2:
+                            teams_found = [team1, team2]
+                            break
 
                 if teams_found:
                     break
@@ -288,11 +480,13 @@ class OCRService:
             if not teams_found:
                 for line in lines:
                     for team_key, team_name in self.team_mappings.items():
-                        if team_key in line.lower():
+                        if team_key in line:
                             if team_name not in teams_found:
                                 teams_found.append(team_name)
                             if len(teams_found) == 2:
                                 break
+                    if len(teams_found) == 2:
+                        break
 
             return teams_found[:2]  # Return max 2 teams
 
@@ -317,14 +511,14 @@ class OCRService:
                     continue
 
                 # Look for over/under patterns
-                over_under_match = re.search(r"(\w+)\s+(over|under)\s+(\d+(?:\.\d)?)", line, re.IGNORECASE)
+                over_under_match = OVER_UNDER_PATTERN.search(line)
                 if over_under_match:
                     team, direction, value = over_under_match.groups()
                     team_name = self._resolve_team_name(team)
                     if team_name:
                         leg = {
                             "team": team_name,
-                            "type": f"{direction.lower()}_total",
+                            "type": f"{direction}_total",
                             "value": float(value),
                             "description": f"{team_name} {direction.title()} {value}",
                         }
@@ -334,7 +528,7 @@ class OCRService:
                             seen_legs.add(leg_sig)
 
                 # Look for moneyline patterns
-                moneyline_match = re.search(r"(\w+)\s+ml\s*([+-]\d{3,4})", line, re.IGNORECASE)
+                moneyline_match = MONEYLINE_PATTERN.search(line)
                 if moneyline_match:
                     team, odds = moneyline_match.groups()
                     team_name = self._resolve_team_name(team)
@@ -351,14 +545,12 @@ class OCRService:
                             seen_legs.add(leg_sig)
 
                 # Look for player props
-                player_match = re.search(
-                    r"(\w+\s+\w+)\s+(hits|runs|rbis|strikeouts)\s+(over|under)\s+(\d+(?:\.\d)?)", line, re.IGNORECASE
-                )
+                player_match = PLAYER_PROP_PATTERN.search(line)
                 if player_match:
                     player, prop_type, direction, value = player_match.groups()
                     leg = {
                         "player": player.title(),
-                        "type": f"{prop_type.lower()}_{direction.lower()}",
+                        "type": f"{prop_type}_{direction}",
                         "value": float(value),
                         "description": f"{player.title()} {prop_type.title()} {direction.title()} {value}",
                     }
@@ -374,30 +566,9 @@ class OCRService:
             else:
                 # Fallback: try to extract any betting line
                 for line in lines:
-                    bet_keywords = [
-                        "over",
-                        "under",
-                        "money line",
-                        "no",
-                        "yes",
-                        "parlay",
-                        "inning",
-                        "earned runs",
-                        "alt",
-                        "hits",
-                        "runs",
-                        "rbis",
-                        "+",
-                        "-",
-                    ]
-
-                    def is_team_line(line):
-                        """Check if line contains team betting info."""
-                        return any(keyword in line.lower() for keyword in bet_keywords)
-
-                    if is_team_line(line):
+                    if BET_LINE_PATTERN.search(line):
                         # Clean up the line for description
-                        clean_line = re.sub(r"[^\w\s@\-+.]", " ", line)
+                        clean_line = LINE_NOISE_PATTERN.sub(" ", line)
                         clean_line = " ".join(clean_line.split())
                         if clean_line and len(clean_line) > 5:
                             candidate = clean_line.strip()
@@ -425,7 +596,7 @@ class OCRService:
 
             # Clean the team text
             team_text = team_text.strip().lower()
-            team_text = re.sub(r"[^\w\s]", "", team_text)
+            team_text = TEAM_NOISE_PATTERN.sub("", team_text)
 
             # Direct mapping lookup
             if team_text in self.team_mappings:
@@ -437,39 +608,24 @@ class OCRService:
                     return value
 
             # Handle common variations
-            variations = {
-                "ny": "New York Yankees",
-                "nyc": "New York Yankees",
-                "la": "Los Angeles Dodgers",
-                "sf": "San Francisco Giants",
-                "sd": "San Diego Padres",
-                "chicago": "Chicago Cubs",
-                "cubs": "Chicago Cubs",
-                "sox": "Chicago White Sox",
-                "white sox": "Chicago White Sox",
-            }
-
-            if team_text in variations:
-                return variations[team_text]
-
-            return None
+            return TEAM_VARIATIONS.get(team_text)
 
         except Exception as e:
             logger.error(f"Error resolving team name '{team_text}': {e}")
             return None
 
     def _extract_description_from_lines(self, lines: List[str]) -> str:
-        """Extract betting description from lines."""
+        """Extract betting description from slip lines, already lowercased by parse_betting_slip."""
         try:
             description_parts = []
             for line in lines:
                 if isinstance(line, str) and line.strip():
                     # Skip metadata lines
-                    if any(keyword in line.lower() for keyword in ["fanatics", "bet id", "gambling", "call"]):
+                    if any(keyword in line for keyword in ["fanatics", "bet id", "gambling", "call"]):
                         continue
 
                     # Clean up the line
-                    clean_line = re.sub(r"[^\w\s@\-+.]", " ", line)
+                    clean_line = LINE_NOISE_PATTERN.sub(" ", line)
                     clean_line = " ".join(clean_line.split())
 
                     if clean_line and len(clean_line) > 3:
@@ -484,19 +640,19 @@ class OCRService:
             return ""
 
     def _is_valid_betting_line(self, line: str) -> bool:
-        """Check if a line contains valid betting information."""
+        """Check if a slip line, already lowercased by parse_betting_slip, contains valid betting information."""
         try:
             if not line or not isinstance(line, str):
                 return False
 
             # Skip metadata lines
             metadata_keywords = ["fanatics", "bet id", "gambling", "call", "1-800"]
-            if any(keyword in line.lower() for keyword in metadata_keywords):
+            if any(keyword in line for keyword in metadata_keywords):
                 return False
 
             # Look for betting indicators
             betting_indicators = ["over", "under", "ml", "money", "parlay", "teaser", "+", "-"]
-            return any(indicator in line.lower() for indicator in betting_indicators)
+            return any(indicator in line for indicator in betting_indicators)
 
         except Exception as e:
             logger.error(f"Error checking betting line validity: {e}")
@@ -3,13 +3,13 @@ Simplified Player Analytics Service - MLB player statistics and analysis
 """
 
 import asyncio
-import json
 import logging
 import os
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 import aiohttp
+from bot.utils.http import create_session, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +17,14 @@ logger = logging.getLogger(__name__)
 class PlayerAnalyticsService:
     """Service for advanced player analytics and matchup analysis."""
 
-    def __init__(self):
-        """Initialize player analytics service."""
-        self.session = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize player analytics service, optionally reusing the bot's shared HTTP session."""
+        self.session = session
+        # Only sessions created here are closed here; a shared one belongs to the bot
+        self._owns_session = session is None
         self.mlb_base = "https://statsapi.mlb.com/api/v1"
         self.timeout = aiohttp.ClientTimeout(total=30)
+        self.headers = {"User-Agent": "GotLockzBot/2.0"}
         self.player_map = {}
         self.mlb_team_ids = [
             108,
@@ -75,7 +78,7 @@ class PlayerAnalyticsService:
 
             if mapping_file:
                 with open(mapping_file, "r") as f:
-                    self.player_map = json.load(f)
+                    self.player_map = json_loads(f.read())
                 logger.info(f"Loaded {len(self.player_map)} players from mapping: {mapping_file}")
             else:
                 logger.warning("Player mapping file not found in any of these paths:")
@@ -87,7 +90,9 @@ class PlayerAnalyticsService:
     async def initialize(self):
         """Initialize the HTTP session."""
         try:
-            self.session = aiohttp.ClientSession(timeout=self.timeout, headers={"User-Agent": "GotLockzBot/2.0"})
+            if self.session is None or self.session.closed:
+                self.session = create_session(self.timeout, headers=self.headers)
+                self._owns_session = True
             logger.info("Player analytics service initialized")
         except Exception as e:
             logger.error(f"Error initializing player analytics service: {e}")
@@ -95,7 +100,7 @@ class PlayerAnalyticsService:
     async def get_player_analytics(self, player_name: str, team_name: str) -> Dict[str, Any]:
         """Get comprehensive player analytics."""
         try:
-            if not self.session:
+            if not self.session or self.session.closed:
                 await self.initialize()
 
             # Get player ID
@@ -103,17 +108,16 @@ class PlayerAnalyticsService:
             if not player_id:
                 return {"error": f"Player {player_name} not found"}
 
-            # Get player stats
-            stats = await self._get_player_stats(player_id)
+            # Season stats, recent games and matchup split only need the player ID,
+            # so fetch them concurrently; each helper handles its own errors
+            stats, recent_performance, matchup_analysis = await asyncio.gather(
+                self._get_player_stats(player_id),
+                self._get_recent_performance(player_id),
+                self._get_matchup_analysis(player_id, team_name),
+            )
             if not stats:
                 return {"error": f"No stats found for {player_name}"}
 
-            # Get recent performance
-            recent_performance = await self._get_recent_performance(player_id)
-
-            # Get matchup analysis
-            matchup_analysis = await self._get_matchup_analysis(player_id, team_name)
-
             return {
                 "player_name": player_name,
                 "team": team_name,
@@ -130,19 +134,19 @@ class PlayerAnalyticsService:
     async def get_matchup_analysis(self, team1: str, team2: str) -> Dict[str, Any]:
         """Get detailed matchup analysis between two teams."""
         try:
-            if not self.session:
+            if not self.session or self.session.closed:
                 await self.initialize()
 
             # Get team IDs
-            team1_id = await self._get_team_id(team1)
-            team2_id = await self._get_team_id(team2)
+            team1_id, team2_id = await asyncio.gather(self._get_team_id(team1), self._get_team_id(team2))
 
             if not team1_id or not team2_id:
                 return {"error": "One or both teams not found"}
 
             # Get team stats
-            team1_stats = await self._get_team_stats(team1_id)
-            team2_stats = await self._get_team_stats(team2_id)
+            team1_stats, team2_stats = await asyncio.gather(
+                self._get_team_stats(team1_id), self._get_team_stats(team2_id)
+            )
 
             # Get head-to-head data
             h2h_data = await self._get_head_to_head(team1_id, team2_id)
@@ -170,11 +174,11 @@ class PlayerAnalyticsService:
             search_url = f"{self.mlb_base}/people"
             params = {"search": player_name, "sportIds": 1, "fields": "people,id,fullName,currentTeam,id,name"}  # MLB
 
-            async with self.session.get(search_url, params=params) as response:
+            async with self.session.get(search_url, params=params, timeout=self.timeout, headers=self.headers) as response:
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 assert data is not None, "Expected non-None data before calling .get()"
                 people = data.get("people", [])
 
@@ -209,11 +213,11 @@ class PlayerAnalyticsService:
                 "fields": "stats,splits,stat,group,type,displayName,value",
             }
 
-            async with self.session.get(stats_url, params=params) as response:
+            async with self.session.get(stats_url, params=params, timeout=self.timeout, headers=self.headers) as response:
                 if response.status != 200:
                     return {}
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 assert data is not None, "Expected non-None data before calling .get()"
                 stats = data.get("stats", [])
 
@@ -245,11 +249,11 @@ class PlayerAnalyticsService:
                 "fields": "stats,splits,stat,group,type,displayName,value,date",
             }
 
-            async with self.session.get(stats_url, params=params) as response:
+            async with self.session.get(stats_url, params=params, timeout=self.timeout, headers=self.headers) as response:
                 if response.status != 200:
                     return {}
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 assert data is not None, "Expected non-None data before calling .get()"
                 stats = data.get("stats", [])
 
@@ -279,11 +283,11 @@ class PlayerAnalyticsService:
                 "fields": "stats,splits,stat,group,type,displayName,value,opponent,id,name",
             }
 
-            async with self.session.get(stats_url, params=params) as response:
+            async with self.session.get(stats_url, params=params, timeout=self.timeout, headers=self.headers) as response:
                 if response.status != 200:
                     return {}
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 assert data is not None, "Expected non-None data before calling .get()"
                 stats = data.get("stats", [])
 
@@ -310,11 +314,11 @@ class PlayerAnalyticsService:
             teams_url = f"{self.mlb_base}/teams"
             params = {"sportIds": 1, "fields": "teams,id,name"}  # MLB
 
-            async with self.session.get(teams_url, params=params) as response:
+            async with self.session.get(teams_url, params=params, timeout=self.timeout, headers=self.headers) as response:
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 assert data is not None, "Expected non-None data before calling .get()"
                 teams = data.get("teams", [])
 
@@ -343,11 +347,11 @@ class PlayerAnalyticsService:
                 "fields": "stats,splits,stat,group,type,displayName,value",
             }
 
-            async with self.session.get(stats_url, params=params) as response:
+            async with self.session.get(stats_url, params=params, timeout=self.timeout, headers=self.headers) as response:
                 if response.status != 200:
                     return {}
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 assert data is not None, "Expected non-None data before calling .get()"
                 stats = data.get("stats", [])
 
@@ -416,7 +420,7 @@ class PlayerAnalyticsService:
     async def close(self):
         """Close the HTTP session."""
         try:
-            if self.session:
+            if self._owns_session and self.session and not self.session.closed:
                 await self.session.close()
         except Exception as e:
             logger.error(f"Error closing player analytics service: {e}")
@@ -12,6 +12,7 @@ from urllib.error import HTTPError
 
 import aiohttp
 import pandas as pd
+from bot.utils.http import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,7 @@ class StatcastService:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = create_session(timeout)
         return self.session
 
     async def get_statcast_data(self, team1: str, team2: str) -> Dict[str, Any]:
@@ -7,6 +7,7 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import aiohttp
+from bot.utils.http import create_session, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +23,7 @@ class StatsService:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=10)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = create_session(timeout)
         return self.session
 
     async def get_live_stats(self, bet_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -83,7 +84,7 @@ class StatsService:
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
 
                 # Find team
                 for team in data.get("teams", []):
@@ -105,7 +106,7 @@ class StatsService:
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 return self._parse_mlb_team_stats(data)
 
         except Exception as e:
@@ -126,7 +127,7 @@ class StatsService:
                 if response.status != 200:
                     return []
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 return self._parse_mlb_live_scores(data)
 
         except Exception as e:
@@ -2,21 +2,113 @@
 Template Service - Handles different posting formats for picks
 """
 
+import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from bot.utils.http import json_dumps, json_loads
+from config.performance_config import COUNTERS_FILE, COUNTERS_FLUSH_INTERVAL
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Read-only placeholder for slips without teams, shared instead of building a new list per call
+DEFAULT_TEAMS = ("TBD", "TBD")
+
 
 class TemplateService:
     """Service for formatting picks with different templates."""
 
-    def __init__(self):
+    def __init__(self, counters_file: str = COUNTERS_FILE):
         self.templates = settings.templates
-        self.vip_play_counter = 1  # Simple counter for VIP play numbers
+        self.counters_file = counters_file
+        self.vip_play_counter = self._load_counters().get("vip_play_counter", 1)
+        self._counters_dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # Serializes flushes so a shutdown write never races a background one on the same temp file
+        self._counters_lock = asyncio.Lock()
+
+    def _load_counters(self) -> Dict[str, int]:
+        """Load persisted counters, starting fresh if the file is missing or unreadable."""
+        try:
+            with open(self.counters_file, "rb") as f:
+                return json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error loading counters from {self.counters_file}: {e}")
+            return {}
+
+    def _write_counters_sync(self, counters: Dict[str, int]):
+        """Atomically replace the counters file."""
+        tmp_path = f"{self.counters_file}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps(counters))
+        os.replace(tmp_path, self.counters_file)
+
+    def _save_counters(self):
+        """Mark counters for the background flush instead of writing on the posting path."""
+        self._counters_dirty = True
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts, tests) - nothing would flush later, so write now
+            self._counters_dirty = False
+            self._write_counters_sync({"vip_play_counter": self.vip_play_counter})
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def flush_counters(self):
+        """Write counters to disk in a worker thread if they changed since the last flush."""
+        async with self._counters_lock:
+            if not self._counters_dirty:
+                return
+            self._counters_dirty = False
+            write = asyncio.ensure_future(
+                asyncio.to_thread(self._write_counters_sync, {"vip_play_counter": self.vip_play_counter})
+            )
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                # The thread keeps running regardless; hold the lock until its file is in place
+                await write
+                raise
+            except Exception as e:
+                self._counters_dirty = True
+                logger.error(f"Error saving counters to {self.counters_file}: {e}")
+
+    async def close(self):
+        """Stop the background flush and persist any outstanding counter changes."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush_counters()
+
+    async def _flush_loop(self):
+        """Persist dirty counters after a short delay, with a final write when cancelled at shutdown.
+
+        A burst of picks coalesces into one write per interval. The loop exits once everything is
+        on disk, so an idle bot does not wake up for nothing; the next increment starts it again.
+        """
+        try:
+            while True:
+                await asyncio.sleep(COUNTERS_FLUSH_INTERVAL)
+                await self.flush_counters()
+                if not self._counters_dirty:
+                    return
+        except asyncio.CancelledError:
+            if self._counters_dirty:
+                self._counters_dirty = False
+                self._write_counters_sync({"vip_play_counter": self.vip_play_counter})
+            raise
 
     def _get_leg_stat_summary(self, leg, stats_data):
         """Return a stat summary string for a leg if stats are available."""
@@ -85,12 +177,14 @@ class TemplateService:
     ) -> str:
         """Format a free play pick to match the Discord screenshot style, with stat summaries and weather/park."""
         try:
-            teams = bet_data.get("teams", ["TBD", "TBD"])
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
             description = bet_data.get("description", "TBD")
             odds = bet_data.get("odds", "TBD")
             legs = bet_data.get("legs", [])
-            current_date = datetime.now().strftime(self.templates.date_format)
-            current_time = datetime.now().strftime(self.templates.time_format)
+            # One clock read so date and time always describe the same instant
+            now = datetime.now()
+            current_date = now.strftime(self.templates.date_format)
+            current_time = now.strftime(self.templates.time_format)
 
             header = f"# __**🔒 FREE PLAY - {current_date} 🔒**__"
             game_info = f"**⚾ GAME:**  __{teams[0]} @ {teams[1]}__  ({current_date} {current_time})"
@@ -126,12 +220,13 @@ class TemplateService:
     ) -> str:
         """Format a VIP pick with multi-leg parlay/SGP support, stat summaries, and weather/park."""
         try:
-            teams = bet_data.get("teams", ["TBD", "TBD"])
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
             odds = bet_data.get("odds", "TBD")
             units = bet_data.get("units", "1")
             legs = bet_data.get("legs", [])
-            current_date = datetime.now().strftime(self.templates.date_format)
-            current_time = datetime.now().strftime(self.templates.time_format)
+            now = datetime.now()
+            current_date = now.strftime(self.templates.date_format)
+            current_time = now.strftime(self.templates.time_format)
 
             header = f"🔒 I VIP PLAY # {self.vip_play_counter} 🏆 - {current_date}"
 
@@ -194,6 +289,7 @@ class TemplateService:
                 content_parts.extend(["", analysis_label, "", analysis_section])
                 content = "\n".join([part for part in content_parts if part])
                 self.vip_play_counter += 1
+                self._save_counters()
                 return content
             else:
                 # Fallback to old format for single-leg bets
@@ -206,12 +302,14 @@ class TemplateService:
                 weather_park_section = self._get_weather_park_summary(stats_data)
                 analysis_label = "👇 I Analysis Below:"
                 analysis_section = analysis if analysis else "Analysis to be provided."
-                content_parts = [header, game_info, "", bet_info, "", units_display]
-                if weather_park_section:
-                    content_parts.extend(["", weather_park_section])
-                content_parts.extend(["", analysis_label, "", analysis_section])
-                content = "\n".join(content_parts)
+                # Fixed layout with one optional block: a single format beats building and joining a list
+                weather_block = f"\n\n{weather_park_section}" if weather_park_section else ""
+                content = (
+                    f"{header}\n{game_info}\n\n{bet_info}\n\n{units_display}{weather_block}"
+                    f"\n\n{analysis_label}\n\n{analysis_section}"
+                )
                 self.vip_play_counter += 1
+                self._save_counters()
                 return content
         except Exception as e:
             logger.error(f"Error formatting VIP pick: {e}")
@@ -222,12 +320,13 @@ class TemplateService:
     ) -> str:
         """Format a lotto ticket pick with stat summaries and weather/park."""
         try:
-            teams = bet_data.get("teams", ["TBD", "TBD"])
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
             description = bet_data.get("description", "TBD")
             odds = bet_data.get("odds", "TBD")
             legs = bet_data.get("legs", [])
-            current_date = datetime.now().strftime(self.templates.date_format)
-            current_time = datetime.now().strftime(self.templates.time_format)
+            now = datetime.now()
+            current_date = now.strftime(self.templates.date_format)
+            current_time = now.strftime(self.templates.time_format)
 
             header = f"{self.templates.lotto_header} – {current_date}"
             game_info = f"⚾ | Game: {teams[0]} @ {teams[1]} ({current_date} {current_time})"
@@ -241,22 +340,16 @@ class TemplateService:
                 summary = self._get_leg_stat_summary(leg, stats_data)
                 if summary:
                     leg_summaries.append(summary)
-            leg_summaries_section = "\n".join(leg_summaries) if leg_summaries else ""
+            legs_block = "\n" + "\n".join(leg_summaries) if leg_summaries else ""
 
             # Add weather/park summary if available
             weather_park_section = self._get_weather_park_summary(stats_data)
+            weather_block = f"\n{weather_park_section}" if weather_park_section else ""
 
-            analysis_section = ""
-            if analysis:
-                analysis_section = f"\n📊 Analysis:\n{analysis}"
+            analysis_block = f"\n📊 Analysis:\n{analysis}" if analysis else ""
 
-            content = f"{header}\n\n{game_info}\n{bet_info}"
-            if leg_summaries_section:
-                content += f"\n{leg_summaries_section}"
-            if weather_park_section:
-                content += f"\n{weather_park_section}"
-            content += f"{analysis_section}"
-            return content
+            # Optional blocks carry their own leading newline, so the ticket is one format
+            return f"{header}\n\n{game_info}\n{bet_info}{legs_block}{weather_block}{analysis_block}"
         except Exception as e:
             logger.error(f"Error formatting lotto ticket: {e}")
             return self._get_fallback_format(bet_data, "LOTTO TICKET")
@@ -264,7 +357,7 @@ class TemplateService:
     def _get_fallback_format(self, bet_data: Dict[str, Any], pick_type: str) -> str:
         """Get fallback format when template formatting fails."""
         try:
-            teams = bet_data.get("teams", ["TBD", "TBD"])
+            teams = bet_data.get("teams", DEFAULT_TEAMS)
             description = bet_data.get("description", "TBD")
             current_date = datetime.now().strftime(self.templates.date_format)
 
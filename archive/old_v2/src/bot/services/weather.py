@@ -4,7 +4,6 @@ Integrates with the weather scraper to get real-time conditions
 """
 
 import asyncio
-import json
 import logging
 import os
 import sys
@@ -2,7 +2,22 @@
 Utility functions and helpers for the GotLockz Bot.
 """
 
-from .performance_limiter import performance_limiter, rate_limit, safe_operation
+from .http import create_session, json_dumps, json_loads, request_with_backoff
+from .interactions import respond_lazily, send_error
+from .performance_limiter import ai_gate, ocr_gate, performance_limiter, rate_limit, safe_operation
 from .system_monitor import system_monitor
 
-__all__ = ["system_monitor", "performance_limiter", "rate_limit", "safe_operation"]
+__all__ = [
+    "system_monitor",
+    "performance_limiter",
+    "rate_limit",
+    "safe_operation",
+    "ocr_gate",
+    "ai_gate",
+    "respond_lazily",
+    "send_error",
+    "request_with_backoff",
+    "json_loads",
+    "json_dumps",
+    "create_session",
+]
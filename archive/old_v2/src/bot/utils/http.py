@@ -0,0 +1,95 @@
+"""
+HTTP Helpers - Shared request handling for outbound API calls
+"""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Any, Callable, Optional, Tuple, Union
+
+import aiohttp
+from config.performance_config import HTTP_DNS_CACHE_TTL, HTTP_KEEPALIVE_TIMEOUT, HTTP_POOL_LIMIT
+
+# orjson is optional - fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_PATTERN = re.compile(r"rate limit|quota", re.IGNORECASE)
+
+
+def create_session(timeout: aiohttp.ClientTimeout, **kwargs) -> aiohttp.ClientSession:
+    """Create a ClientSession whose pooled sockets stay alive between calls."""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT, keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT, ttl_dns_cache=HTTP_DNS_CACHE_TTL
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, **kwargs)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _is_retryable(status: int, body: str) -> bool:
+    """Decide whether a response looks like a transient failure."""
+    if status in RETRYABLE_STATUSES:
+        return True
+    return status >= 400 and bool(RATE_LIMIT_PATTERN.search(body))
+
+
+async def request_with_backoff(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    *,
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 8.0,
+    data_factory: Optional[Callable[[], Any]] = None,
+    **kwargs,
+) -> Tuple[int, str]:
+    """Send a request, retrying 429/5xx and connection errors with exponential backoff.
+
+    Returns the final (status, body text). `data_factory` rebuilds the request body on every
+    attempt for payloads that cannot be sent twice, such as `aiohttp.FormData`.
+    """
+    for attempt in range(retries):
+        last_attempt = attempt == retries - 1
+        delay = min(max_delay, base_delay * 2**attempt)
+
+        if data_factory is not None:
+            kwargs["data"] = data_factory()
+
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                status = response.status
+                body = await response.text()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if last_attempt:
+                raise
+            logger.warning(f"{method} {url} failed ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        if last_attempt or not _is_retryable(status, body):
+            return status, body
+
+        logger.warning(f"{method} {url} returned {status}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    raise RuntimeError("request_with_backoff called with retries < 1")
@@ -0,0 +1,49 @@
+"""
+Interaction Helpers - Respond to slash commands without unnecessary deferrals
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Dict
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Discord expires an unacknowledged interaction after 3s; defer well before that
+DEFER_THRESHOLD_SECONDS = 2.0
+
+
+async def respond_lazily(
+    interaction: discord.Interaction,
+    work: Awaitable[Dict[str, Any]],
+    threshold: float = DEFER_THRESHOLD_SECONDS,
+    ephemeral: bool = True,
+) -> None:
+    """Send the result of `work` inline, deferring only if it runs past `threshold`.
+
+    `work` must resolve to the keyword arguments for the message (content, embed, ...).
+    When it finishes in time the reply goes out with a single `send_message`; otherwise the
+    interaction is deferred and the reply is delivered through the followup webhook.
+    """
+    task = asyncio.ensure_future(work)
+
+    try:
+        payload = await asyncio.wait_for(asyncio.shield(task), timeout=threshold)
+    except asyncio.TimeoutError:
+        logger.info(f"Work exceeded {threshold}s, deferring interaction response")
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=ephemeral, thinking=True)
+        payload = await task
+        await interaction.followup.send(ephemeral=ephemeral, **payload)
+        return
+
+    await interaction.response.send_message(ephemeral=ephemeral, **payload)
+
+
+async def send_error(interaction: discord.Interaction, message: str) -> None:
+    """Send an ephemeral error whether or not the interaction was already acknowledged."""
+    if interaction.response.is_done():
+        await interaction.followup.send(message, ephemeral=True)
+    else:
+        await interaction.response.send_message(message, ephemeral=True)
@@ -8,6 +8,8 @@ import time
 from functools import wraps
 from typing import Any, Callable, Dict, Optional
 
+from config.performance_config import AI_CONCURRENCY, AI_MIN_REQUEST_INTERVAL, OCR_CONCURRENCY
+
 from .system_monitor import system_monitor
 
 logger = logging.getLogger(__name__)
@@ -50,9 +52,9 @@ class PerformanceLimiter:
 
     async def wait_for_system_health(self, timeout: float = 30.0) -> bool:
         """Wait for system to become healthy."""
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             if await self.check_system_health():
                 return True
             await asyncio.sleep(1)
@@ -68,7 +70,7 @@ class PerformanceLimiter:
                 raise RuntimeError("System did not recover within timeout")
 
         # Apply rate limiting
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last = current_time - self.last_request_time
 
         if time_since_last < self.min_request_interval:
@@ -77,7 +79,7 @@ class PerformanceLimiter:
 
         # Use semaphore for concurrent request limiting
         async with self.request_semaphore:
-            self.last_request_time = time.time()
+            self.last_request_time = time.monotonic()
             result = await func(*args, **kwargs)
 
             # Update adaptive limits
@@ -115,9 +117,41 @@ class PerformanceLimiter:
         logger.info("Emergency throttling disabled")
 
 
+class RequestGate:
+    """Caps concurrent calls to one upstream and spaces out their start times."""
+
+    def __init__(self, max_concurrent: int, min_interval: float = 0.0):
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.min_interval = min_interval
+        self.last_start = 0.0
+        self._interval_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            if self.min_interval > 0:
+                async with self._interval_lock:
+                    wait_time = self.min_interval - (time.monotonic() - self.last_start)
+                    if wait_time > 0:
+                        await asyncio.sleep(wait_time)
+                    self.last_start = time.monotonic()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+        return False
+
+
 # Global performance limiter instance
 performance_limiter = PerformanceLimiter()
 
+# Shared gates so bursts of slip uploads cannot saturate OCR or trip AI rate limits
+ocr_gate = RequestGate(OCR_CONCURRENCY)
+ai_gate = RequestGate(AI_CONCURRENCY, min_interval=AI_MIN_REQUEST_INTERVAL)
+
 
 def rate_limit(max_requests: int = 5):
     """Decorator to rate limit functions."""
@@ -4,7 +4,6 @@ System Monitor - Prevents computer overheating and performance issues
 
 import asyncio
 import logging
-import os
 import platform
 from dataclasses import dataclass
 from datetime import datetime
@@ -95,8 +94,8 @@ class SystemMonitor:
     async def get_current_metrics(self) -> SystemMetrics:
         """Get current system metrics."""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage - sampling sleeps for the whole interval, so keep it off the event loop
+            cpu_percent = await asyncio.to_thread(psutil.cpu_percent, 1)
 
             # Memory usage
             memory = psutil.virtual_memory()
@@ -185,11 +184,14 @@ class SystemMonitor:
             ]
 
             for temp_file in temp_files:
-                if os.path.exists(temp_file):
+                # Open directly rather than checking os.path.exists first: one syscall, no race
+                try:
                     with open(temp_file, "r") as f:
                         temp_raw = f.read().strip()
-                        # Convert from millidegrees to degrees
-                        return float(temp_raw) / 1000.0
+                except FileNotFoundError:
+                    continue
+                # Convert from millidegrees to degrees
+                return float(temp_raw) / 1000.0
             return None
         except Exception:
             return None
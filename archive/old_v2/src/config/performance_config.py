@@ -16,10 +16,35 @@ MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
 MIN_REQUEST_INTERVAL = float(os.getenv("MIN_REQUEST_INTERVAL", "0.2"))  # 200ms between requests
 MAX_REQUESTS_PER_MINUTE = int(os.getenv("MAX_REQUESTS_PER_MINUTE", "60"))
 
+# OCR / AI Concurrency Limits
+OCR_CONCURRENCY = int(os.getenv("OCR_CONCURRENCY", "4"))
+AI_CONCURRENCY = int(os.getenv("AI_CONCURRENCY", "8"))
+AI_MIN_REQUEST_INTERVAL = float(os.getenv("AI_MIN_REQUEST_INTERVAL", "0.05"))  # 50ms between AI calls
+OCR_PROCESS_WORKERS = int(os.getenv("OCR_PROCESS_WORKERS", "0"))  # 0 = prepare slip images on threads
+
 # Cache Settings
 CACHE_TIMEOUT_STATS = int(os.getenv("CACHE_TIMEOUT_STATS", "300"))  # 5 minutes
 CACHE_TIMEOUT_WEATHER = int(os.getenv("CACHE_TIMEOUT_WEATHER", "300"))  # 5 minutes
 CACHE_TIMEOUT_LIVE = int(os.getenv("CACHE_TIMEOUT_LIVE", "60"))  # 1 minute
+CACHE_TIMEOUT_GAME_DATA = int(os.getenv("CACHE_TIMEOUT_GAME_DATA", "120"))  # 2 minutes
+CACHE_TIMEOUT_OCR = int(os.getenv("CACHE_TIMEOUT_OCR", "600"))  # 10 minutes
+MAX_OCR_CACHE_ENTRIES = int(os.getenv("MAX_OCR_CACHE_ENTRIES", "128"))
+CACHE_TIMEOUT_ANALYSIS = int(os.getenv("CACHE_TIMEOUT_ANALYSIS", "600"))  # 10 minutes
+MAX_ANALYSIS_CACHE_ENTRIES = int(os.getenv("MAX_ANALYSIS_CACHE_ENTRIES", "512"))
+MAX_COMMAND_CACHE_ENTRIES = int(os.getenv("MAX_COMMAND_CACHE_ENTRIES", "256"))
+
+# Persistence Settings
+COUNTERS_FILE = os.getenv("COUNTERS_FILE", "counters.json")
+COUNTERS_FLUSH_INTERVAL = float(os.getenv("COUNTERS_FLUSH_INTERVAL", "2.0"))  # seconds between counter writes
+COMMAND_SIGNATURE_FILE = os.getenv("COMMAND_SIGNATURE_FILE", ".command_sig")
+
+# Upload Limits
+MAX_SLIP_IMAGE_BYTES = int(os.getenv("MAX_SLIP_IMAGE_BYTES", str(8 * 1024 * 1024)))  # 8 MB
+
+# HTTP Connection Pool
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "20"))
+HTTP_KEEPALIVE_TIMEOUT = int(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "60"))  # seconds to keep idle sockets
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))  # 5 minutes
 
 # Timeout Settings
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "10"))  # 10 seconds
@@ -98,11 +123,16 @@ def get_performance_config() -> Dict[str, Any]:
             "max_concurrent_requests": MAX_CONCURRENT_REQUESTS,
             "min_request_interval": MIN_REQUEST_INTERVAL,
             "max_requests_per_minute": MAX_REQUESTS_PER_MINUTE,
+            "ocr_concurrency": OCR_CONCURRENCY,
+            "ai_concurrency": AI_CONCURRENCY,
+            "ai_min_request_interval": AI_MIN_REQUEST_INTERVAL,
+            "ocr_process_workers": OCR_PROCESS_WORKERS,
         },
         "caching": {
             "stats_timeout": CACHE_TIMEOUT_STATS,
             "weather_timeout": CACHE_TIMEOUT_WEATHER,
             "live_timeout": CACHE_TIMEOUT_LIVE,
+            "game_data_timeout": CACHE_TIMEOUT_GAME_DATA,
         },
         "timeouts": {
             "request_timeout": REQUEST_TIMEOUT,
@@ -85,6 +85,8 @@ class APIConfig:
 
     openai_api_key: str
     openai_model: str = "gpt-4"
+    ocr_space_api_key: str = ""
+    openweather_api_key: str = ""
 
 
 @dataclass
@@ -130,7 +132,10 @@ class Settings:
         )
 
         self.api = APIConfig(
-            openai_api_key=os.getenv("OPENAI_API_KEY", ""), openai_model=os.getenv("OPENAI_MODEL", "gpt-4")
+            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+            openai_model=os.getenv("OPENAI_MODEL", "gpt-4"),
+            ocr_space_api_key=os.getenv("OCR_SPACE_API_KEY", "K87115193688957"),
+            openweather_api_key=os.getenv("OPENWEATHER_API_KEY", ""),
         )
 
         self.channels = ChannelConfig(
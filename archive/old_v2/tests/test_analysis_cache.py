@@ -0,0 +1,67 @@
+"""
+Test reuse of AI analyses for identical pick contexts
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import bot.services.analysis as analysis_module
+from bot.services.analysis import CONTEXT_ERROR, AnalysisService
+
+
+def _fake_client(calls, content="Take the over. Lock it in."):
+    """OpenAI client stand-in that records each completion request."""
+
+    def create(**kwargs):
+        calls.append(kwargs["messages"][-1]["content"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+class TestAnalysisCache:
+    """Test that the analysis cache skips repeat API calls without storing failures."""
+
+    def test_repeated_context_skips_api(self, monkeypatch):
+        """The second request for the same context is answered from the cache."""
+        service = AnalysisService()
+        calls = []
+        monkeypatch.setattr(service, "_get_client", lambda: _fake_client(calls))
+
+        async def run():
+            return [await service._generate_ai_analysis("NYY @ BOS, Over 8.5") for _ in range(2)]
+
+        first, second = asyncio.run(run())
+        assert len(calls) == 1
+        assert first.endswith("Take the over. Lock it in.")
+        assert second.endswith("Take the over. Lock it in.")
+
+    def test_oldest_context_is_evicted_when_full(self, monkeypatch):
+        """Past MAX_ANALYSIS_CACHE_ENTRIES the least recently used context is dropped."""
+        monkeypatch.setattr(analysis_module, "MAX_ANALYSIS_CACHE_ENTRIES", 2)
+        service = AnalysisService()
+        calls = []
+        monkeypatch.setattr(service, "_get_client", lambda: _fake_client(calls))
+
+        async def run():
+            for context in ("game 1", "game 2", "game 1", "game 3", "game 2"):
+                await service._generate_ai_analysis(context)
+
+        asyncio.run(run())
+        # "game 1" was refreshed before "game 3" arrived, so "game 2" was the one evicted
+        assert len(calls) == 4
+        assert len(service._analysis_cache) == 2
+
+    def test_error_context_is_not_cached(self, monkeypatch):
+        """An analysis of the context-building error placeholder is regenerated every time."""
+        service = AnalysisService()
+        calls = []
+        monkeypatch.setattr(service, "_get_client", lambda: _fake_client(calls))
+
+        async def run():
+            for _ in range(2):
+                await service._generate_ai_analysis(CONTEXT_ERROR)
+
+        asyncio.run(run())
+        assert len(calls) == 2
+        assert not service._analysis_cache
@@ -0,0 +1,45 @@
+"""
+Test the slash command signature used to skip redundant syncs
+"""
+
+import asyncio
+
+from bot.main import GotLockzBot
+from discord import app_commands
+
+
+class TestCommandSignature:
+    """Test that the signature follows everything Discord stores for a command."""
+
+    def test_changed_choice_changes_signature(self, tmp_path, monkeypatch):
+        """Adding a choice to /pick post forces a sync on the next start."""
+        monkeypatch.chdir(tmp_path)
+
+        async def run():
+            bot = GotLockzBot()
+            await bot.load_extension("bot.commands.pick")
+            before = bot._command_signature()
+
+            post = bot.tree.get_command("pick").get_command("post")
+            post._params["channel_type"].choices.append(app_commands.Choice(name="Parlay", value="parlay"))
+            after = bot._command_signature()
+
+            await bot.unload_extension("bot.commands.pick")
+            return before, after
+
+        before, after = asyncio.run(run())
+        assert before != after
+
+    def test_signature_is_stable(self, tmp_path, monkeypatch):
+        """An unchanged command tree hashes the same, so the sync is skipped."""
+        monkeypatch.chdir(tmp_path)
+
+        async def run():
+            bot = GotLockzBot()
+            await bot.load_extension("bot.commands.pick")
+            signatures = bot._command_signature(), bot._command_signature()
+            await bot.unload_extension("bot.commands.pick")
+            return signatures
+
+        first, second = asyncio.run(run())
+        assert first == second
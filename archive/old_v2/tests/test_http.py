@@ -0,0 +1,37 @@
+"""
+Test retry classification for outbound HTTP calls
+"""
+
+from bot.utils.http import _is_retryable, json_dumps, json_loads
+
+
+class TestIsRetryable:
+    """Test which responses are treated as transient."""
+
+    def test_retries_throttling_and_server_errors(self):
+        """429 and 5xx gateway errors are retried."""
+        for status in (429, 500, 502, 503, 504):
+            assert _is_retryable(status, "")
+
+    def test_retries_rate_limit_body(self):
+        """Providers that report quota errors with other 4xx codes are retried."""
+        assert _is_retryable(403, "Rate limit exceeded for this API key")
+
+    def test_does_not_retry_success_or_client_errors(self):
+        """Successful and plain client-error responses are returned as-is."""
+        assert not _is_retryable(200, "rate limit info in body")
+        assert not _is_retryable(404, "Not Found")
+
+
+class TestJsonLoads:
+    """Test the JSON helpers."""
+
+    def test_parses_text_and_bytes(self):
+        """Both str bodies and raw bytes decode to the same object."""
+        payload = '{"teams": ["NYY", "BOS"], "total": 8.5}'
+        assert json_loads(payload) == json_loads(payload.encode()) == {"teams": ["NYY", "BOS"], "total": 8.5}
+
+    def test_dumps_round_trips(self):
+        """Serialized bytes parse back to the original object."""
+        counters = {"vip_play_counter": 7}
+        assert json_loads(json_dumps(counters)) == counters
@@ -0,0 +1,86 @@
+"""
+Test reuse of combined game data for repeated matchups and of the scraper setup
+"""
+
+import asyncio
+
+import bot.services.mlb_integrated_service as mlb_module
+from bot.services.mlb_integrated_service import MLBIntegratedService
+
+
+class FakeScraper:
+    """Scraper stand-in that counts game data fetches."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_game_data(self, team1, team2):
+        self.calls += 1
+        return {"teams": {team1: {"stats": {"wins": 90}}, team2: {}}}
+
+
+def _service():
+    service = MLBIntegratedService()
+    service.scraper = FakeScraper()
+    service.initialized = True
+    return service
+
+
+def _fetch_twice(service):
+    async def run():
+        bet_data = {"teams": ["New York Yankees", "Boston Red Sox"]}
+        first = await service.get_comprehensive_game_data(bet_data)
+        first["team1"]["basic_stats"]["wins"] = 0
+        second = await service.get_comprehensive_game_data(bet_data)
+        return first, second
+
+    return asyncio.run(run())
+
+
+class TestGameDataCache:
+    """Test the short-lived matchup cache in MLBIntegratedService."""
+
+    def test_repeated_matchup_is_served_from_cache(self):
+        """A second lookup within the TTL does not hit the scraper."""
+        service = _service()
+        _fetch_twice(service)
+        assert service.scraper.calls == 1
+
+    def test_expired_entry_is_refetched(self, monkeypatch):
+        """Once the TTL has passed the scraper is asked again."""
+        monkeypatch.setattr(mlb_module, "CACHE_TIMEOUT_GAME_DATA", 0)
+        service = _service()
+        _fetch_twice(service)
+        assert service.scraper.calls == 2
+
+    def test_callers_get_independent_copies(self):
+        """Editing a returned result does not leak into the next caller's copy."""
+        first, second = _fetch_twice(_service())
+        assert first["team1"]["basic_stats"]["wins"] == 0
+        assert second["team1"]["basic_stats"]["wins"] == 90
+
+
+class TestInitialize:
+    """Test that overlapping initialize calls share one scraper."""
+
+    def test_concurrent_initialize_creates_one_scraper(self, monkeypatch):
+        """A warmup and a game lookup racing to initialize build the scraper once."""
+        created = []
+
+        class SlowScraper:
+            def __init__(self, session=None):
+                created.append(self)
+
+            async def initialize(self):
+                await asyncio.sleep(0.01)
+                return True
+
+        monkeypatch.setattr(mlb_module, "MLBScraper", SlowScraper)
+        service = MLBIntegratedService()
+
+        async def run():
+            return await asyncio.gather(service.initialize(), service.initialize())
+
+        assert asyncio.run(run()) == [True, True]
+        assert len(created) == 1
+        assert service.initialized
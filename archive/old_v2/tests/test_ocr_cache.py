@@ -0,0 +1,94 @@
+"""
+Test reuse of OCR results for repeated slip images
+"""
+
+import asyncio
+import io
+
+from bot.services.ocr import OCRService
+
+
+class TestOCRResultCache:
+    """Test that identical images are only sent to OCR once."""
+
+    def test_repeated_image_skips_ocr(self, monkeypatch):
+        """The second submission of the same bytes is served from the cache."""
+        service = OCRService()
+        calls = []
+
+        async def fake_ocr(image):
+            calls.append(image)
+            return "Yankees vs Red Sox\nOver 8.5 -110"
+
+        monkeypatch.setattr(service, "_extract_text_ocr_space", fake_ocr)
+
+        async def run():
+            first = await service.extract_bet_data(b"slip")
+            first["description"] = "edited by caller"
+            second = await service.extract_bet_data(b"slip")
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert len(calls) == 1
+        assert second["description"] != "edited by caller"
+
+    def test_failed_ocr_is_not_cached(self, monkeypatch):
+        """Empty OCR output is retried on the next submission."""
+        service = OCRService()
+        calls = []
+
+        async def fake_ocr(image):
+            calls.append(image)
+            return ""
+
+        monkeypatch.setattr(service, "_extract_text_ocr_space", fake_ocr)
+
+        async def run():
+            await service.extract_bet_data(b"slip")
+            await service.extract_bet_data(b"slip")
+
+        asyncio.run(run())
+        assert len(calls) == 2
+
+    def test_concurrent_identical_images_share_one_ocr(self, monkeypatch):
+        """Simultaneous uploads of the same slip wait on a single OCR call."""
+        service = OCRService()
+        calls = []
+
+        async def fake_ocr(image):
+            calls.append(image)
+            await asyncio.sleep(0.01)
+            return "Yankees vs Red Sox\nOver 8.5 -110"
+
+        monkeypatch.setattr(service, "_extract_text_ocr_space", fake_ocr)
+
+        async def run():
+            return await asyncio.gather(*(service.extract_bet_data(b"slip") for _ in range(3)))
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(result["teams"] == results[0]["teams"] for result in results)
+        assert not service._inflight
+
+    def test_file_stream_is_keyed_and_rewound(self, tmp_path, monkeypatch):
+        """A non-BytesIO stream maps to the same entry as its bytes and is handed to OCR unread."""
+        service = OCRService()
+        seen = []
+
+        async def fake_ocr(image):
+            seen.append(image.read() if hasattr(image, "read") else image)
+            return "Yankees vs Red Sox\nOver 8.5 -110"
+
+        monkeypatch.setattr(service, "_extract_text_ocr_space", fake_ocr)
+        slip = tmp_path / "slip.png"
+        slip.write_bytes(b"slip")
+
+        async def run():
+            with open(slip, "rb") as stream:
+                first = await service.extract_bet_data(stream)
+            second = await service.extract_bet_data(io.BytesIO(b"slip"))
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert seen == [b"slip"]
+        assert first["teams"] and first["teams"] == second["teams"]
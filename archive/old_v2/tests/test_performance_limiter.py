@@ -0,0 +1,63 @@
+"""
+Test request gating for OCR and AI calls
+"""
+
+import asyncio
+import time
+
+from bot.utils.performance_limiter import RequestGate
+
+
+class TestRequestGate:
+    """Test the concurrency/interval gate."""
+
+    def test_caps_concurrency(self):
+        """Never lets more than max_concurrent callers in at once."""
+        gate = RequestGate(2)
+        active = 0
+        peak = 0
+
+        async def worker():
+            nonlocal active, peak
+            async with gate:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak == 2
+
+    def test_spaces_out_starts(self):
+        """Consecutive callers start at least min_interval apart."""
+        gate = RequestGate(4, min_interval=0.05)
+        starts = []
+
+        async def worker():
+            async with gate:
+                starts.append(time.monotonic())
+
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(3)))
+
+        asyncio.run(run())
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    def test_releases_on_error(self):
+        """A failing caller does not leak a semaphore slot."""
+        gate = RequestGate(1)
+
+        async def run():
+            try:
+                async with gate:
+                    raise ValueError("boom")
+            except ValueError:
+                pass
+            async with gate:
+                return True
+
+        assert asyncio.run(run())
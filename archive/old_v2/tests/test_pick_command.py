@@ -0,0 +1,185 @@
+"""
+Test the pick extension lifecycle and the !pick dashboard fan-out
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import bot.commands.pick as pick_module
+import discord
+from bot.commands.pick import PickCommand, PickCommands
+from bot.services.mlb_scraper import MLBScraper
+from discord.ext import commands
+
+
+class TestExtensionLifecycle:
+    """Test that unloading the pick extension persists /pick state."""
+
+    def test_unload_writes_counters(self, tmp_path, monkeypatch):
+        """An unflushed VIP counter is on disk once the extension is gone."""
+        monkeypatch.chdir(tmp_path)
+
+        async def run():
+            bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+            await bot.load_extension("bot.commands.pick")
+            group = bot.get_cog("PickCommand").pick_group
+            assert bot.tree.get_command("pick") is group
+
+            group.template_service.vip_play_counter = 7
+            group.template_service._save_counters()
+            await bot.unload_extension("bot.commands.pick")
+
+        asyncio.run(run())
+        assert json.loads((tmp_path / "counters.json").read_text()) == {"vip_play_counter": 7}
+
+    def test_close_cancels_background_tasks(self, tmp_path, monkeypatch):
+        """A warmup still running when the group closes is cancelled and awaited."""
+        monkeypatch.chdir(tmp_path)
+
+        async def run():
+            group = PickCommands(SimpleNamespace())
+            task = group._spawn(asyncio.sleep(60))
+            await group.close()
+            return task
+
+        task = asyncio.run(run())
+        assert task.cancelled()
+
+
+class TestGameDashboard:
+    """Test the !pick dashboard fan-out and what it caches."""
+
+    def test_failed_branch_degrades_to_empty(self, tmp_path, monkeypatch):
+        """A raising matchup lookup is replaced by an empty result; the other branches still land."""
+        monkeypatch.chdir(tmp_path)
+        cog = PickCommand(SimpleNamespace())
+
+        async def game_data(bet_data):
+            return {"team1": {}, "team2": {}}
+
+        async def matchup(team1, team2):
+            raise RuntimeError("statsapi down")
+
+        async def live_updates():
+            return {"active_games": [], "total_active": 0}
+
+        monkeypatch.setattr(cog.mlb_service, "get_comprehensive_game_data", game_data)
+        monkeypatch.setattr(cog.player_service, "get_matchup_analysis", matchup)
+        cog.mlb_service.scraper = SimpleNamespace(get_live_game_updates=live_updates)
+
+        dashboard = asyncio.run(cog._get_game_dashboard("Yankees", "Red Sox"))
+
+        assert dashboard == {
+            "game_data": {"team1": {}, "team2": {}},
+            "matchup_analysis": {},
+            "live_updates": {"active_games": [], "total_active": 0},
+        }
+
+
+    def test_repeat_pick_gets_fresh_game_data(self, tmp_path, monkeypatch):
+        """A second !pick within the matchup TTL reuses the matchup but asks the service for game data again."""
+        monkeypatch.chdir(tmp_path)
+        cog = PickCommand(SimpleNamespace())
+        cog.mlb_service.initialized = True
+        game_calls, matchup_calls, embedded = [], [], []
+
+        async def game_data(bet_data):
+            game_calls.append(bet_data)
+            return {"team1": {"score": len(game_calls)}, "team2": {}}
+
+        async def matchup(team1, team2):
+            matchup_calls.append((team1, team2))
+            return {"key_matchups": []}
+
+        async def build_embed(game_data, weather_impact, matchup_analysis, live_updates, team1, team2):
+            embedded.append(game_data["team1"]["score"])
+            return discord.Embed()
+
+        async def edit(embed):
+            pass
+
+        async def send(embed):
+            return SimpleNamespace(edit=edit)
+
+        monkeypatch.setattr(cog.mlb_service, "get_comprehensive_game_data", game_data)
+        monkeypatch.setattr(cog.player_service, "get_matchup_analysis", matchup)
+        monkeypatch.setattr(cog, "_build_advanced_embed", build_embed)
+        ctx = SimpleNamespace(send=send)
+
+        async def run():
+            for _ in range(2):
+                await cog.pick.callback(cog, ctx, "Yankees", "Red Sox")
+
+        asyncio.run(run())
+        assert embedded == [1, 2]
+        assert len(game_calls) == 2
+        assert len(matchup_calls) == 1
+
+
+class TestPlayerLookup:
+    """Test the cached !player lookup."""
+
+    def test_failed_lookup_is_not_cached(self, tmp_path, monkeypatch):
+        """An error result is retried on the next call, a successful one is reused."""
+        monkeypatch.chdir(tmp_path)
+        cog = PickCommand(SimpleNamespace())
+        results = [{"error": "Player Judge not found"}, {"player_name": "Aaron Judge", "stats": {}}]
+        calls = []
+
+        async def analytics(player_name, team_name):
+            calls.append((player_name, team_name))
+            return results[len(calls) - 1]
+
+        monkeypatch.setattr(cog.player_service, "get_player_analytics", analytics)
+
+        async def lookup():
+            return await cog._cached(("player", "judge", ""), 15, lambda: cog._get_player_analytics("Judge", ""))
+
+        async def run():
+            return [await lookup() for _ in range(3)]
+
+        assert asyncio.run(run()) == [None, results[1], results[1]]
+        assert len(calls) == 2
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Expired entries are purged on insert and the least recently used one goes past the cap."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(pick_module, "MAX_COMMAND_CACHE_ENTRIES", 2)
+        cog = PickCommand(SimpleNamespace())
+
+        async def value(name):
+            return {"player_name": name}
+
+        async def run():
+            await cog._cached(("player", "expired"), 0, lambda: value("expired"))
+            for name in ("a", "b", "a", "c"):
+                await cog._cached(("player", name), 15, lambda name=name: value(name))
+
+        asyncio.run(run())
+        # "a" was reused before "c" arrived, so "b" was the one evicted
+        assert list(cog._cache) == [("player", "a"), ("player", "c")]
+
+
+class TestLiveGameUpdates:
+    """Test the live update summary built from the schedule."""
+
+    def test_only_in_progress_games_are_active(self, monkeypatch):
+        """Final and scheduled games are left out, and a game ID narrows the result."""
+        scraper = MLBScraper(session=SimpleNamespace(closed=False))
+
+        async def live_scores():
+            return [
+                {"game_id": 1, "status": "In Progress"},
+                {"game_id": 2, "status": "Final"},
+                {"game_id": 3, "status": "In Progress"},
+            ]
+
+        monkeypatch.setattr(scraper, "_get_live_scores", live_scores)
+
+        updates = asyncio.run(scraper.get_live_game_updates())
+        single = asyncio.run(scraper.get_live_game_updates("3"))
+
+        assert [game["game_id"] for game in updates["active_games"]] == [1, 3]
+        assert updates["total_active"] == 2
+        assert [game["game_id"] for game in single["active_games"]] == [3]
@@ -0,0 +1,123 @@
+"""
+Test VIP counter persistence in the template service
+"""
+
+import asyncio
+import json
+
+from bot.services.templates import TemplateService
+
+
+class TestCounterPersistence:
+    """Test that VIP play numbers survive restarts without blocking the posting path."""
+
+    def test_loads_saved_counter(self, tmp_path):
+        """A new service resumes numbering from the counters file."""
+        counters_file = tmp_path / "counters.json"
+        counters_file.write_text(json.dumps({"vip_play_counter": 42}))
+
+        assert TemplateService(counters_file=str(counters_file)).vip_play_counter == 42
+
+    def test_flush_writes_only_when_dirty(self, tmp_path):
+        """Increments inside the event loop are deferred to flush_counters."""
+        counters_file = tmp_path / "counters.json"
+        service = TemplateService(counters_file=str(counters_file))
+
+        async def run():
+            service.vip_play_counter += 1
+            service._save_counters()
+            assert not counters_file.exists()
+            await service.flush_counters()
+            service._flush_task.cancel()
+
+        asyncio.run(run())
+        assert json.loads(counters_file.read_text()) == {"vip_play_counter": 2}
+
+    def test_burst_coalesces_into_one_write(self, tmp_path, monkeypatch):
+        """Several increments within one interval are written once, then the flush loop stops."""
+        monkeypatch.setattr("bot.services.templates.COUNTERS_FLUSH_INTERVAL", 0.01)
+        service = TemplateService(counters_file=str(tmp_path / "counters.json"))
+        writes = []
+        service._write_counters_sync = writes.append
+
+        async def run():
+            for _ in range(5):
+                service.vip_play_counter += 1
+                service._save_counters()
+            await service._flush_task
+
+        asyncio.run(run())
+        assert writes == [{"vip_play_counter": 6}]
+        assert service._flush_task.done()
+
+    def test_close_flushes_pending_changes(self, tmp_path):
+        """Shutting down writes an increment the background loop has not flushed yet."""
+        counters_file = tmp_path / "counters.json"
+        service = TemplateService(counters_file=str(counters_file))
+
+        async def run():
+            service.vip_play_counter += 1
+            service._save_counters()
+            await service.close()
+
+        asyncio.run(run())
+        assert json.loads(counters_file.read_text()) == {"vip_play_counter": 2}
+
+    def test_close_during_flush_keeps_latest_value(self, tmp_path):
+        """A shutdown that interrupts a background write still leaves the newest counter on disk."""
+        counters_file = tmp_path / "counters.json"
+        service = TemplateService(counters_file=str(counters_file))
+
+        async def run():
+            service.vip_play_counter += 1
+            service._save_counters()
+            service._flush_task.cancel()
+            service._flush_task = asyncio.ensure_future(service.flush_counters())
+            await asyncio.sleep(0)
+            service.vip_play_counter += 1
+            service._save_counters()
+            await service.close()
+
+        asyncio.run(run())
+        assert json.loads(counters_file.read_text()) == {"vip_play_counter": 3}
+        assert not (tmp_path / "counters.json.tmp").exists()
+
+
+class TestVipFormat:
+    """Test the single-leg VIP layout."""
+
+    def test_single_leg_layout(self, tmp_path):
+        """Sections are separated by blank lines, with weather only when available."""
+        service = TemplateService(counters_file=str(tmp_path / "counters.json"))
+        service._get_weather_park_summary = lambda stats_data: "🌦️ Weather: 75°F"
+        bet_data = {"teams": ["Yankees", "Red Sox"], "description": "Yankees ML", "odds": "-120", "units": "2"}
+
+        lines = service.format_vip_pick(bet_data, analysis="Lock it in.").split("\n")
+
+        assert lines[2:] == [
+            "",
+            "🏆 I Yankees ML (-120)",
+            "",
+            "💵 I Unit Size: 2",
+            "",
+            "🌦️ Weather: 75°F",
+            "",
+            "👇 I Analysis Below:",
+            "",
+            "Lock it in.",
+        ]
+
+
+class TestLottoFormat:
+    """Test the lotto ticket layout."""
+
+    def test_optional_blocks_follow_bet_line(self, tmp_path):
+        """Leg stats, weather and analysis each add a block only when present."""
+        service = TemplateService(counters_file=str(tmp_path / "counters.json"))
+        service._get_weather_park_summary = lambda stats_data: ""
+        service._get_leg_stat_summary = lambda leg, stats_data: "📊 Judge: 2 HR"
+        bet_data = {"teams": ["Yankees", "Red Sox"], "description": "Judge HR", "odds": "+450", "legs": [{}]}
+
+        lines = service.format_lotto_ticket(bet_data, analysis="Swing big.").split("\n")
+
+        assert lines[3:] == ["🎯 | Bet: Judge HR | Odds: +450", "📊 Judge: 2 HR", "📊 Analysis:", "Swing big."]